@@ -346,7 +346,7 @@ class EnhancedIngestionPipeline:
             metadata = doc_metadata.items[0] if doc_metadata.items else ExtractedMetadata()
             
             result.tax_years_found = metadata.tax_years
-            result.forms_found = [f['code'] for f in metadata.forms]
+            result.forms_found = [f.code for f in metadata.forms]
             result.thresholds_found = len(metadata.thresholds)
             
             # Determine document properties
@@ -432,7 +432,7 @@ class EnhancedIngestionPipeline:
                     contains_deadline=chunk.contains_deadline,
                     contains_example=chunk.contains_example,
                     tax_years=chunk_metadata.tax_years,
-                    forms_referenced=[f['code'] for f in chunk_metadata.forms],
+                    forms_referenced=[f.code for f in chunk_metadata.forms],
                     keywords=chunk_metadata.keywords,
                 )
                 chunk_creates.append(chunk_create)
@@ -481,7 +481,7 @@ class EnhancedIngestionPipeline:
                             formula_name=formula.formula_name,
                             formula_text=formula.formula_text,
                             formula_description=formula.formula_description,
-                            variables=formula.variables,
+                            variables=formula.variables_dict,
                             formula_logic=formula.formula_logic,
                             tax_year=formula.tax_year,
                             source_url=gov_uk_doc.url,
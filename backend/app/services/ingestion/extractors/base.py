@@ -6,15 +6,19 @@ Provides common interface and utilities.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, TypeVar, Generic
+from typing import List, Dict, Any, Optional, TypeVar, Generic, Callable, Sequence
 from datetime import datetime
+import multiprocessing
+import os
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
+R = TypeVar('R')
 
 
 @dataclass
@@ -73,10 +77,14 @@ class BaseExtractor(ABC):
         re.IGNORECASE
     )
     TAX_YEAR_PATTERN = re.compile(r'(\d{4})[/-](\d{2,4})')
+    NUMBER_PATTERN = re.compile(r'^[\d,]+(?:\.\d+)?$')
     
     # HMRC form references
     FORM_PATTERN = re.compile(r'\b(SA\d{2,3}[A-Z]?|CT\d{3}|VAT\d{1,3}|P\d{2}[A-Z]?|P60|P45|P11D)\b', re.IGNORECASE)
     
+    # Values infer_column_type looks at per column
+    COLUMN_TYPE_SAMPLE_SIZE = 10
+    
     def __init__(self):
         """Initialize the base extractor."""
         pass
@@ -107,14 +115,72 @@ class BaseExtractor(ABC):
     # UTILITY METHODS
     # =========================================================================
     
+    def map_in_processes(
+        self,
+        func: Callable[..., R],
+        *iterables: Sequence[Any],
+        workers: Optional[int] = None,
+        min_items: int = 1,
+        chunksize: int = 1
+    ) -> List[R]:
+        """
+        Map func over the iterables using a process pool.
+        
+        Workers are started with forkserver, or spawn where that is not
+        available, never fork: a forked child would copy any lock another
+        thread holds at that moment (the extractor caches are locked) and
+        could wait on it forever. func and its arguments are pickled, so
+        func must be a module-level function or a method of a picklable
+        extractor. Fewer than min_items items, or a single worker, run
+        serially in this process.
+        
+        Args:
+            func: Called with one item from each iterable
+            *iterables: Arguments for func, all the same length
+            workers: Number of worker processes (default: CPU count)
+            min_items: Smallest batch worth starting workers for
+            chunksize: Items sent to a worker at a time
+        
+        Returns:
+            One result per item, in input order
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(iterables[0]) < min_items:
+            return list(map(func, *iterables))
+        
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(start_method)
+        ) as executor:
+            return list(executor.map(func, *iterables, chunksize=chunksize))
+    
     def clean_text(self, text: str) -> str:
         """Clean and normalize text."""
         if not text:
             return ""
         
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Normalize whitespace; str.split() breaks on exactly the characters
+        # \s matches, without going through the regex engine
+        return ' '.join(text.split())
+    
+    def lowercase_text(self, text: str) -> str:
+        """
+        Lowercase text without changing its length.
+        
+        Lets case-sensitive patterns run over the lowercased copy while
+        match offsets still index into the original text. 'İ' is the only
+        character whose lower() is longer than one code point, so it is
+        folded to plain 'i' as IGNORECASE matching would. IGNORECASE also
+        matches dotless 'ı' and long 'ſ' with 'i' and 's', so they are
+        folded the same way.
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            lowered = text.replace('İ', 'i').lower()
+        if 'ı' in lowered or 'ſ' in lowered:
+            lowered = lowered.replace('ı', 'i').replace('ſ', 's')
+        return lowered
     
     def parse_gbp_amount(self, text: str) -> Optional[float]:
         """
@@ -242,12 +308,12 @@ class BaseExtractor(ABC):
             return "text"
         
         # Sample up to 10 values
-        sample = values[:10]
+        sample = values[:self.COLUMN_TYPE_SAMPLE_SIZE]
         
         # Count type matches
         currency_count = sum(1 for v in sample if self.GBP_PATTERN.search(str(v)))
         percentage_count = sum(1 for v in sample if self.PERCENTAGE_PATTERN.search(str(v)))
-        number_count = sum(1 for v in sample if re.match(r'^[\d,]+(?:\.\d+)?$', str(v).strip()))
+        number_count = sum(1 for v in sample if self.NUMBER_PATTERN.match(str(v).strip()))
         
         total = len(sample)
         
@@ -17,6 +17,8 @@ Example Formulas in UK Tax Documents:
 - Penalty calculation: Tax due × penalty rate × days late
 """
 
+from bisect import bisect_right
+from collections import namedtuple
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 import re
@@ -26,6 +28,16 @@ from .base import BaseExtractor, ExtractionResult
 
 logger = logging.getLogger(__name__)
 
+# Separator placed between documents when a batch is scanned as one corpus
+DOC_SEPARATOR = "\n\x1e\n"
+
+# One row per formula variable; default_value and symbol are optional
+FormulaVariable = namedtuple(
+    'FormulaVariable',
+    'name type description default_value symbol',
+    defaults=(None, None)
+)
+
 
 @dataclass
 class ExtractedFormula:
@@ -41,7 +53,7 @@ class ExtractedFormula:
     formula_description: str   # Explanation of what it calculates
     
     # === Variables ===
-    variables: Dict[str, Dict[str, Any]]  # {name: {type, description, example}}
+    variables: Tuple[FormulaVariable, ...]  # Rows, see variables_dict
     
     # === Logic (for execution) ===
     formula_logic: Dict[str, Any]  # Structured representation
@@ -56,13 +68,26 @@ class ExtractedFormula:
     # === Context ===
     context_text: str = ""  # Surrounding text for RAG
     
+    @property
+    def variables_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Variables as {name: {type, description, default_value, symbol}}."""
+        materialized = {}
+        for var in self.variables:
+            entry = {"type": var.type, "description": var.description}
+            if var.default_value is not None:
+                entry["default_value"] = var.default_value
+            if var.symbol is not None:
+                entry["symbol"] = var.symbol
+            materialized[var.name] = entry
+        return materialized
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "formula_name": self.formula_name,
             "formula_type": self.formula_type,
             "formula_text": self.formula_text,
             "formula_description": self.formula_description,
-            "variables": self.variables,
+            "variables": self.variables_dict,
             "formula_logic": self.formula_logic,
             "tables_used": self.tables_used,
             "tax_year": self.tax_year,
@@ -88,70 +113,114 @@ class FormulaExtractor(BaseExtractor):
         for formula in result.items:
             print(f"Found: {formula.formula_name}")
             print(f"  Formula: {formula.formula_text}")
-            print(f"  Variables: {formula.variables}")
+            print(f"  Variables: {formula.variables_dict}")
     """
     
     # =========================================================================
     # FORMULA DETECTION PATTERNS
     # =========================================================================
+    # All patterns are case-sensitive and run over a lowercased copy of the
+    # text (see BaseExtractor.lowercase_text), so their literals are lowercase.
     
-    # Main calculation indicators
-    CALCULATION_PATTERNS = [
+    # Main calculation indicators. Possessive quantifiers (++, {m,n}+) are
+    # used where giving characters back can never produce a match, so a
+    # near-miss fails without backtracking through the run.
+    CALCULATION_PATTERNS = (
         # Explicit formula statements
         re.compile(
-            r'(?:the\s+)?(?:calculation|formula|equation)\s+is[:\s]+(.{20,200})',
-            re.IGNORECASE
+            r'(?:the\s+)?(?:calculation|formula|equation)\s+is[:\s]+(.{20,200}+)'
         ),
         # "calculated as/by"
         re.compile(
-            r'(?:is\s+)?calculated\s+(?:as|by)[:\s]+(.{20,200})',
-            re.IGNORECASE
+            r'(?:is\s+)?calculated\s+(?:as|by)[:\s]+(.{20,200}+)'
         ),
         # Mathematical notation with equals
         re.compile(
-            r'([A-Z][a-zA-Z\s]+)\s*=\s*([^.]+(?:×|x|\*|/|÷|\+|-)[^.]+)',
-            re.IGNORECASE
+            r'([a-z][a-z\s]++)\s*=\s*([^.]+(?:×|x|\*|/|÷|\+|-)[^.]+)'
         ),
         # Fraction patterns like 3/200
         re.compile(
-            r'(\d+/\d+)\s*[×x\*]\s*\(([^)]+)\)',
-            re.IGNORECASE
+            r'(\d+/\d+)\s*[×x\*]\s*\(([^)]+)\)'
         ),
-    ]
+    )
+    
+    # All calculation indicators as one alternation, so the text is scanned
+    # once and overlapping matches of different indicators are skipped
+    CALCULATION_UNION_PATTERN = re.compile(
+        '|'.join(f'(?:{p.pattern})' for p in CALCULATION_PATTERNS)
+    )
     
     # Specific formula types
     MARGINAL_RELIEF_PATTERN = re.compile(
         r'(?:marginal\s+relief|small\s+profits\s+rate).{0,50}(3/200|\d+/\d+).{0,100}',
-        re.IGNORECASE | re.DOTALL
+        re.DOTALL
     )
     
     TAX_CALCULATION_PATTERN = re.compile(
         r'(?:tax\s+(?:due|payable|liability)|income\s+tax|corporation\s+tax).{0,30}(?:=|is\s+calculated).{0,150}',
-        re.IGNORECASE | re.DOTALL
+        re.DOTALL
     )
     
     PENALTY_CALCULATION_PATTERN = re.compile(
         r'(?:penalty|surcharge).{0,30}(?:=|is\s+calculated|amounts?\s+to).{0,150}',
-        re.IGNORECASE | re.DOTALL
+        re.DOTALL
     )
     
     VAT_CALCULATION_PATTERN = re.compile(
         r'(?:vat\s+(?:due|payable|amount)).{0,30}(?:=|is\s+calculated).{0,150}',
-        re.IGNORECASE | re.DOTALL
+        re.DOTALL
     )
     
     RELIEF_CALCULATION_PATTERN = re.compile(
         r'(?:relief|allowance|deduction).{0,30}(?:=|is\s+calculated).{0,150}',
-        re.IGNORECASE | re.DOTALL
+        re.DOTALL
+    )
+    
+    # Text no formula pattern can match without: every calculation indicator
+    # and specific pattern needs one of these (extract's early exit)
+    FORMULA_INDICATOR_PATTERN = re.compile(
+        r'calculat|formula|equation|=|\d+/\d+|amounts?\s+to'
+    )
+    # Same indicators for ASCII text scanned as bytes. Bytes \s lacks the
+    # \x1c-\x1f separators that str \s matches, so they are listed explicitly.
+    FORMULA_INDICATOR_BYTES_PATTERN = re.compile(
+        rb'calculat|formula|equation|=|\d+/\d+|amounts?[\s\x1c-\x1f]+to'
+    )
+    
+    # What has_formulas looks for: wording that suggests a calculation,
+    # including operator words that extract() itself doesn't act on
+    HAS_FORMULAS_PATTERN = re.compile(
+        r'calculated\s+(?:as|by)'
+        r'|=\s*[^=]'  # equals sign not doubled
+        r'|\d+/\d+\s*[×x\*]'  # fraction times something
+        r'|formula'
+        r'|multiply|divide|subtract|add',
+        re.I
+    )
+    
+    # Prefilter: one pass over the leading literal of every formula pattern.
+    # Each named group is the kind of extraction a hit makes worth running.
+    PREFILTER_PATTERN = re.compile(
+        r'(?P<marginal_relief>marginal\s+relief|small\s+profits\s+rate)'
+        r'|(?P<tax_calculation>tax\s+(?:due|payable|liability)|income\s+tax|corporation\s+tax)'
+        r'|(?P<penalty_calculation>penalty|surcharge)'
+        r'|(?P<vat_calculation>vat\s+(?:due|payable|amount))'
+        r'|(?P<generic>calculat|formula|equation|=|\d+/\d+)'
+    )
+    
+    # Formula name patterns, tried in order against the formula context
+    NAME_PATTERNS = (
+        re.compile(r'(?:to\s+)?calculate\s+(?:the\s+)?([a-z]+(?:\s+[a-z]+){0,2})'),
+        re.compile(r'([a-z]+(?:\s+[a-z]+){0,2})\s+(?:is\s+)?calculated'),
     )
     
     # Variable patterns
     VARIABLE_PATTERNS = {
-        'income': re.compile(r'\b(?:income|earnings?|profits?|turnover)\b', re.I),
-        'rate': re.compile(r'\b(?:rate|percentage|%)\b', re.I),
-        'threshold': re.compile(r'\b(?:threshold|limit|allowance)\b', re.I),
-        'period': re.compile(r'\b(?:days?|months?|years?|period)\b', re.I),
-        'amount': re.compile(r'\b(?:amount|sum|total|value)\b', re.I),
+        'income': re.compile(r'\b(?:income|earnings?|profits?|turnover)\b'),
+        'rate': re.compile(r'\b(?:rate|percentage|%)\b'),
+        'threshold': re.compile(r'\b(?:threshold|limit|allowance)\b'),
+        'period': re.compile(r'\b(?:days?|months?|years?|period)\b'),
+        'amount': re.compile(r'\b(?:amount|sum|total|value)\b'),
     }
     
     # Mathematical operators
@@ -183,45 +252,15 @@ class FormulaExtractor(BaseExtractor):
         if not text_content:
             return result
         
+        if not self._has_formula_indicators(text_content):
+            logger.debug(f"No formula indicators in {source_url}")
+            return result
+        
+        lowered = self.lowercase_text(text_content)
         tax_year = kwargs.get('tax_year') or self.extract_tax_year(text_content)
         
         try:
-            # Extract different formula types
-            formulas = []
-            
-            # Check for specific formula types
-            if self.MARGINAL_RELIEF_PATTERN.search(text_content):
-                formula = self._extract_marginal_relief(text_content, tax_year)
-                if formula:
-                    formulas.append(formula)
-            
-            if self.TAX_CALCULATION_PATTERN.search(text_content):
-                formula = self._extract_tax_calculation(text_content, tax_year)
-                if formula:
-                    formulas.append(formula)
-            
-            if self.PENALTY_CALCULATION_PATTERN.search(text_content):
-                formula = self._extract_penalty_calculation(text_content, tax_year)
-                if formula:
-                    formulas.append(formula)
-            
-            if self.VAT_CALCULATION_PATTERN.search(text_content):
-                formula = self._extract_vat_calculation(text_content, tax_year)
-                if formula:
-                    formulas.append(formula)
-            
-            # Generic formula extraction
-            for pattern in self.CALCULATION_PATTERNS:
-                for match in pattern.finditer(text_content):
-                    formula = self._parse_generic_formula(
-                        match.group(0), 
-                        text_content,
-                        match.start(),
-                        tax_year
-                    )
-                    if formula and not self._is_duplicate(formula, formulas):
-                        formulas.append(formula)
-            
+            formulas = self._extract_formulas(text_content, lowered, tax_year)
             result.items = formulas
             logger.info(f"Extracted {len(formulas)} formulas from {source_url}")
             
@@ -230,6 +269,133 @@ class FormulaExtractor(BaseExtractor):
         
         return result
     
+    def extract_batch(
+        self,
+        docs: List[Tuple[str, str]],
+        **kwargs
+    ) -> List[ExtractionResult[ExtractedFormula]]:
+        """
+        Extract formulas from many documents at once.
+        
+        The documents are joined into one corpus and PREFILTER_PATTERN is
+        run over it a single time. Each hit is mapped back to its document
+        through an offset table, and only the extractions a document had a
+        hit for are run on it. Documents without any hit are never touched.
+        
+        Args:
+            docs: List of (text_content, source_url) pairs
+            **kwargs: Same extractor parameters as extract()
+        
+        Returns:
+            One ExtractionResult per document, in input order
+        """
+        results = [ExtractionResult[ExtractedFormula](source_url=url) for _, url in docs]
+        if not docs:
+            return results
+        
+        # Start offset of each document within the joined corpus
+        offsets = []
+        position = 0
+        for text, _ in docs:
+            offsets.append(position)
+            position += len(text) + len(DOC_SEPARATOR)
+        joined = self.lowercase_text(DOC_SEPARATOR.join(text for text, _ in docs))
+        
+        # First hit offset per formula kind, relative to each document
+        hits: List[Dict[str, int]] = [{} for _ in docs]
+        position = 0
+        while True:
+            match = self.PREFILTER_PATTERN.search(joined, position)
+            if not match:
+                break
+            doc_idx = bisect_right(offsets, match.start()) - 1
+            doc_end = offsets[doc_idx] + len(docs[doc_idx][0])
+            if match.end() > doc_end:
+                # Hit straddles the separator; resume at the next document
+                position = doc_end
+                continue
+            hits[doc_idx].setdefault(match.lastgroup, match.start() - offsets[doc_idx])
+            position = match.end()
+        
+        for (text, source_url), offset, doc_hits, result in zip(docs, offsets, hits, results):
+            if not doc_hits:
+                continue
+            tax_year = kwargs.get('tax_year') or self.extract_tax_year(text)
+            try:
+                lowered = joined[offset:offset + len(text)]
+                result.items = self._extract_formulas(text, lowered, tax_year, doc_hits)
+            except Exception as e:
+                result.add_error(f"Formula extraction failed: {str(e)}")
+        
+        logger.info(
+            f"Extracted {sum(r.count for r in results)} formulas "
+            f"from {len(docs)} documents"
+        )
+        return results
+    
+    def _extract_formulas(
+        self,
+        text: str,
+        lowered: str,
+        tax_year: Optional[str],
+        hits: Optional[Dict[str, int]] = None
+    ) -> List[ExtractedFormula]:
+        """
+        Run the formula extractions over a single document.
+        
+        Args:
+            text: Document text
+            lowered: Lowercased text from lowercase_text(), searched by the
+                     patterns; its offsets index into text
+            tax_year: Tax year to attach to extracted formulas
+            hits: Prefilter hits as {kind: first offset}. When given, only
+                  the kinds present are extracted, each searching from its
+                  first hit. None runs every extraction from the start.
+        """
+        formulas = []
+        # Spans already explained by a specific formula type
+        covered: List[Tuple[int, int]] = []
+        
+        # Check for specific formula types
+        specific_extractors = (
+            ('marginal_relief', self.MARGINAL_RELIEF_PATTERN, self._extract_marginal_relief),
+            ('tax_calculation', self.TAX_CALCULATION_PATTERN, self._extract_tax_calculation),
+            ('penalty_calculation', self.PENALTY_CALCULATION_PATTERN, self._extract_penalty_calculation),
+            ('vat_calculation', self.VAT_CALCULATION_PATTERN, self._extract_vat_calculation),
+        )
+        for kind, pattern, extract_specific in specific_extractors:
+            if hits is None:
+                start = 0
+            elif kind in hits:
+                start = hits[kind]
+            else:
+                continue
+            match = pattern.search(lowered, start)
+            if not match:
+                continue
+            formula = extract_specific(text, match, tax_year)
+            if formula:
+                formulas.append(formula)
+                covered.append(match.span())
+        
+        # Generic formula extraction
+        if hits is None or 'generic' in hits:
+            for match in self.CALCULATION_UNION_PATTERN.finditer(lowered):
+                position = match.start()
+                if any(span_start <= position < span_end for span_start, span_end in covered):
+                    continue
+                formula = self._parse_generic_formula(
+                    text,
+                    lowered,
+                    match.start(),
+                    match.end(),
+                    tax_year
+                )
+                if formula and not self._is_duplicate(formula, formulas):
+                    formulas.append(formula)
+        
+        return formulas
+    
     def _is_duplicate(
         self, 
         new_formula: ExtractedFormula, 
@@ -246,6 +412,7 @@ class FormulaExtractor(BaseExtractor):
     def _extract_marginal_relief(
         self, 
         text: str, 
+        match: re.Match,
         tax_year: Optional[str]
     ) -> Optional[ExtractedFormula]:
         """
@@ -257,24 +424,18 @@ class FormulaExtractor(BaseExtractor):
         - P = Augmented profits
         - TTP = Taxable total profits
         """
-        match = self.MARGINAL_RELIEF_PATTERN.search(text)
-        if not match:
-            return None
-        
         context_start = max(0, match.start() - 200)
         context_end = min(len(text), match.end() + 200)
-        context = text[context_start:context_end]
         
         # Extract the fraction (usually 3/200)
-        fraction_match = re.search(r'(\d+)/(\d+)', match.group(0))
-        fraction = "3/200" if not fraction_match else f"{fraction_match.group(1)}/{fraction_match.group(2)}"
+        fraction = self._scan_fraction(match.group(0)) or "3/200"
         
         # Standard upper limit
         upper_limit = 250000
-        ul_match = re.search(r'£([\d,]+)\s*(?:upper\s+limit)?', context)
-        if ul_match:
+        amount = self._scan_gbp_digits(text, context_start, context_end)
+        if amount:
             try:
-                upper_limit = int(ul_match.group(1).replace(',', ''))
+                upper_limit = int(amount.replace(',', ''))
             except ValueError:
                 pass
         
@@ -283,29 +444,12 @@ class FormulaExtractor(BaseExtractor):
             formula_type="marginal_relief",
             formula_text=f"Marginal Relief = {fraction} × (£{upper_limit:,} - Augmented Profits) × (Taxable Profits / Augmented Profits)",
             formula_description="Calculates the marginal relief for corporation tax when profits fall between the small profits rate and main rate thresholds",
-            variables={
-                "augmented_profits": {
-                    "type": "currency_gbp",
-                    "description": "Company's augmented profits (profits + dividends from non-group companies)",
-                    "symbol": "P"
-                },
-                "taxable_profits": {
-                    "type": "currency_gbp",
-                    "description": "Taxable total profits of the company",
-                    "symbol": "TTP"
-                },
-                "upper_limit": {
-                    "type": "currency_gbp",
-                    "description": "Upper profits limit",
-                    "default_value": upper_limit,
-                    "symbol": "UL"
-                },
-                "fraction": {
-                    "type": "fraction",
-                    "description": "Marginal relief fraction",
-                    "default_value": fraction
-                }
-            },
+            variables=(
+                FormulaVariable("augmented_profits", "currency_gbp", "Company's augmented profits (profits + dividends from non-group companies)", symbol="P"),
+                FormulaVariable("taxable_profits", "currency_gbp", "Taxable total profits of the company", symbol="TTP"),
+                FormulaVariable("upper_limit", "currency_gbp", "Upper profits limit", upper_limit, symbol="UL"),
+                FormulaVariable("fraction", "fraction", "Marginal relief fraction", fraction),
+            ),
             formula_logic={
                 "type": "marginal_relief",
                 "steps": [
@@ -317,26 +461,59 @@ class FormulaExtractor(BaseExtractor):
             },
             tables_used=["Corporation Tax Rates"],
             tax_year=tax_year,
-            context_text=context
+            context_text=text[context_start:context_end]
         )
     
+    def _scan_fraction(self, text: str) -> Optional[str]:
+        """Return the first "digits/digits" run in text, e.g. "3/200"."""
+        slash = text.find('/')
+        while slash != -1:
+            if (0 < slash < len(text) - 1
+                    and text[slash - 1].isdecimal() and text[slash + 1].isdecimal()):
+                start = slash - 1
+                while start > 0 and text[start - 1].isdecimal():
+                    start -= 1
+                end = slash + 2
+                while end < len(text) and text[end].isdecimal():
+                    end += 1
+                return text[start:end]
+            slash = text.find('/', slash + 1)
+        return None
+    
+    def _scan_gbp_digits(
+        self,
+        text: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> Optional[str]:
+        """Return the digits and commas following the first usable '£' in text[start:end]."""
+        if end is None:
+            end = len(text)
+        pound = text.find('£', start, end)
+        while pound != -1:
+            stop = pound + 1
+            while stop < end and (text[stop].isdecimal() or text[stop] == ','):
+                stop += 1
+            if stop > pound + 1:
+                return text[pound + 1:stop]
+            pound = text.find('£', stop, end)
+        return None
+    
     def _extract_tax_calculation(
         self, 
         text: str, 
+        match: re.Match,
         tax_year: Optional[str]
     ) -> Optional[ExtractedFormula]:
         """Extract generic tax calculation formula."""
-        match = self.TAX_CALCULATION_PATTERN.search(text)
-        if not match:
-            return None
-        
         context_start = max(0, match.start() - 100)
         context_end = min(len(text), match.end() + 100)
-        context = text[context_start:context_end]
         
-        # Determine if income tax or corporation tax
-        is_income_tax = 'income tax' in context.lower()
-        is_corp_tax = 'corporation tax' in context.lower()
+        # Determine if income tax or corporation tax. The match was made on
+        # the lowercased text, so its context is already lowercase there.
+        context_lower = match.string[context_start:context_end]
+        is_income_tax = 'income tax' in context_lower
+        is_corp_tax = 'corporation tax' in context_lower
         
         if is_income_tax:
             return ExtractedFormula(
@@ -344,28 +521,18 @@ class FormulaExtractor(BaseExtractor):
                 formula_type="tax_calculation",
                 formula_text="Income Tax = (Taxable Income - Personal Allowance) × Tax Rate",
                 formula_description="Calculates income tax by applying the appropriate tax rate to taxable income after deducting the personal allowance",
-                variables={
-                    "taxable_income": {
-                        "type": "currency_gbp",
-                        "description": "Total taxable income from all sources"
-                    },
-                    "personal_allowance": {
-                        "type": "currency_gbp",
-                        "description": "Tax-free personal allowance",
-                        "default_value": 12570
-                    },
-                    "tax_rate": {
-                        "type": "percentage",
-                        "description": "Applicable tax rate based on income band"
-                    }
-                },
+                variables=(
+                    FormulaVariable("taxable_income", "currency_gbp", "Total taxable income from all sources"),
+                    FormulaVariable("personal_allowance", "currency_gbp", "Tax-free personal allowance", 12570),
+                    FormulaVariable("tax_rate", "percentage", "Applicable tax rate based on income band"),
+                ),
                 formula_logic={
                     "type": "banded_calculation",
                     "uses_table": "income_tax_rates"
                 },
                 tables_used=["Income Tax Rates"],
                 tax_year=tax_year,
-                context_text=context
+                context_text=text[context_start:context_end]
             )
         elif is_corp_tax:
             return ExtractedFormula(
@@ -373,23 +540,17 @@ class FormulaExtractor(BaseExtractor):
                 formula_type="tax_calculation",
                 formula_text="Corporation Tax = Taxable Profits × Corporation Tax Rate",
                 formula_description="Calculates corporation tax on company profits",
-                variables={
-                    "taxable_profits": {
-                        "type": "currency_gbp",
-                        "description": "Company's taxable profits"
-                    },
-                    "tax_rate": {
-                        "type": "percentage",
-                        "description": "Corporation tax rate (main rate or small profits rate)"
-                    }
-                },
+                variables=(
+                    FormulaVariable("taxable_profits", "currency_gbp", "Company's taxable profits"),
+                    FormulaVariable("tax_rate", "percentage", "Corporation tax rate (main rate or small profits rate)"),
+                ),
                 formula_logic={
                     "type": "simple_multiplication",
                     "may_require_marginal_relief": True
                 },
                 tables_used=["Corporation Tax Rates"],
                 tax_year=tax_year,
-                context_text=context
+                context_text=text[context_start:context_end]
             )
         
         return None
@@ -397,122 +558,95 @@ class FormulaExtractor(BaseExtractor):
     def _extract_penalty_calculation(
         self, 
         text: str, 
+        match: re.Match,
         tax_year: Optional[str]
     ) -> Optional[ExtractedFormula]:
         """Extract penalty calculation formula."""
-        match = self.PENALTY_CALCULATION_PATTERN.search(text)
-        if not match:
-            return None
-        
         context_start = max(0, match.start() - 100)
         context_end = min(len(text), match.end() + 100)
-        context = text[context_start:context_end]
         
         return ExtractedFormula(
             formula_name="Penalty Calculation",
             formula_type="penalty_calculation",
             formula_text="Penalty = Base Penalty + (Daily Penalty × Days Late)",
             formula_description="Calculates late filing or payment penalties",
-            variables={
-                "base_penalty": {
-                    "type": "currency_gbp",
-                    "description": "Fixed penalty for being late"
-                },
-                "daily_penalty": {
-                    "type": "currency_gbp",
-                    "description": "Additional daily penalty (if applicable)"
-                },
-                "days_late": {
-                    "type": "number",
-                    "description": "Number of days past deadline"
-                }
-            },
+            variables=(
+                FormulaVariable("base_penalty", "currency_gbp", "Fixed penalty for being late"),
+                FormulaVariable("daily_penalty", "currency_gbp", "Additional daily penalty (if applicable)"),
+                FormulaVariable("days_late", "number", "Number of days past deadline"),
+            ),
             formula_logic={
                 "type": "penalty_tiered",
                 "uses_table": "penalty_schedule"
             },
             tables_used=["Penalty Schedule"],
             tax_year=tax_year,
-            context_text=context
+            context_text=text[context_start:context_end]
         )
     
     def _extract_vat_calculation(
         self, 
         text: str, 
+        match: re.Match,
         tax_year: Optional[str]
     ) -> Optional[ExtractedFormula]:
         """Extract VAT calculation formula."""
-        match = self.VAT_CALCULATION_PATTERN.search(text)
-        if not match:
-            return None
-        
         context_start = max(0, match.start() - 100)
         context_end = min(len(text), match.end() + 100)
-        context = text[context_start:context_end]
         
         return ExtractedFormula(
             formula_name="VAT Calculation",
             formula_type="vat_calculation",
             formula_text="VAT = Net Amount × VAT Rate",
             formula_description="Calculates VAT on goods or services",
-            variables={
-                "net_amount": {
-                    "type": "currency_gbp",
-                    "description": "Net value excluding VAT"
-                },
-                "vat_rate": {
-                    "type": "percentage",
-                    "description": "VAT rate (standard 20%, reduced 5%, or zero 0%)",
-                    "default_value": 20
-                }
-            },
+            variables=(
+                FormulaVariable("net_amount", "currency_gbp", "Net value excluding VAT"),
+                FormulaVariable("vat_rate", "percentage", "VAT rate (standard 20%, reduced 5%, or zero 0%)", 20),
+            ),
             formula_logic={
                 "type": "simple_multiplication",
                 "default_rate": 20
             },
             tables_used=["VAT Rates"],
             tax_year=tax_year,
-            context_text=context
+            context_text=text[context_start:context_end]
         )
     
     def _parse_generic_formula(
         self, 
-        formula_text: str, 
-        full_text: str,
-        position: int,
+        full_text: str, 
+        lowered: str,
+        start: int,
+        end: int,
         tax_year: Optional[str]
     ) -> Optional[ExtractedFormula]:
-        """Parse a generic formula pattern."""
+        """Parse a generic formula pattern matched at full_text[start:end]."""
         # Skip if too short or too long
-        if len(formula_text) < 10 or len(formula_text) > 300:
+        if end - start < 10 or end - start > 300:
             return None
         
+        formula_text = full_text[start:end]
+        formula_lower = lowered[start:end]
+        
         # Get context
-        context_start = max(0, position - 100)
-        context_end = min(len(full_text), position + len(formula_text) + 100)
-        context = full_text[context_start:context_end]
+        context_start = max(0, start - 100)
+        context_end = min(len(full_text), end + 100)
+        context_lower = lowered[context_start:context_end]
         
         # Try to identify formula name from context
         formula_name = "Calculation"
-        name_patterns = [
-            r'(?:to\s+)?calculate\s+(?:the\s+)?([a-z]+(?:\s+[a-z]+){0,2})',
-            r'([a-z]+(?:\s+[a-z]+){0,2})\s+(?:is\s+)?calculated',
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, context, re.I)
+        for pattern in self.NAME_PATTERNS:
+            match = pattern.search(context_lower)
             if match:
                 formula_name = match.group(1).title()
                 break
         
         # Extract variables mentioned
-        variables = {}
-        for var_name, pattern in self.VARIABLE_PATTERNS.items():
-            if pattern.search(formula_text):
-                variables[var_name] = {
-                    "type": "unknown",
-                    "description": f"Variable: {var_name}"
-                }
+        variables = tuple(
+            FormulaVariable(var_name, "unknown", f"Variable: {var_name}")
+            for var_name, pattern in self.VARIABLE_PATTERNS.items()
+            if pattern.search(formula_lower)
+        )
         
         return ExtractedFormula(
             formula_name=formula_name,
@@ -522,17 +656,23 @@ class FormulaExtractor(BaseExtractor):
             variables=variables,
             formula_logic={"type": "generic", "raw_text": formula_text},
             tax_year=tax_year,
-            context_text=context
+            context_text=full_text[context_start:context_end]
         )
     
     def has_formulas(self, text: str) -> bool:
         """Quick check if text likely contains formulas."""
-        formula_indicators = [
-            r'calculated\s+(?:as|by)',
-            r'=\s*[^=]',  # equals sign not doubled
-            r'\d+/\d+\s*[×x\*]',  # fraction times something
-            r'formula',
-            r'multiply|divide|subtract|add',
-        ]
-        
-        return any(re.search(p, text, re.I) for p in formula_indicators)
+        return bool(text) and self.HAS_FORMULAS_PATTERN.search(text) is not None
+    
+    def _has_formula_indicators(self, text: str) -> bool:
+        """
+        Prefilter for extract(): a single scan for FORMULA_INDICATOR_PATTERN.
+        
+        False means extract() would find nothing. ASCII text is scanned as
+        bytes, which re searches faster than str.
+        """
+        if not text:
+            return False
+        if text.isascii():
+            buf = text.encode('ascii').lower()
+            return self.FORMULA_INDICATOR_BYTES_PATTERN.search(buf) is not None
+        return self.FORMULA_INDICATOR_PATTERN.search(self.lowercase_text(text)) is not None
@@ -15,36 +15,113 @@ This metadata enables:
 - Hybrid search (semantic + keyword)
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, replace
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable, Iterable, Hashable, TypeVar
+import hashlib
+import itertools
 import re
+import threading
 import logging
 
 from .base import BaseExtractor, ExtractionResult
 
 logger = logging.getLogger(__name__)
 
+R = TypeVar('R')
 
-@dataclass
+
+def _dedup_records(items: Iterable[R], key: Callable[[R], Hashable]) -> List[R]:
+    """Keep the first record for each key, preserving order."""
+    seen = set()
+    unique = []
+    for item in items:
+        item_key = key(item)
+        if item_key not in seen:
+            seen.add(item_key)
+            unique.append(item)
+    return unique
+
+
+def _invert_keywords(groups: Dict[str, Tuple[str, ...]]) -> 'MappingProxyType[str, Tuple[str, ...]]':
+    """Map each keyword to the groups that list it, in group order."""
+    index: Dict[str, Tuple[str, ...]] = {}
+    for group, keywords in groups.items():
+        for keyword in keywords:
+            index[keyword] = index.get(keyword, ()) + (group,)
+    return MappingProxyType(index)
+
+
+@dataclass(slots=True, frozen=True)
+class Threshold:
+    """A monetary threshold, e.g. £90,000 VAT registration."""
+    value: int
+    type: str
+    context: str
+    formatted: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "value": self.value,
+            "type": self.type,
+            "context": self.context,
+            "formatted": self.formatted,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class FormReference:
+    """An HMRC form referenced in the text, e.g. SA100."""
+    code: str
+    name: str
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "code": self.code,
+            "name": self.name,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class KeyDate:
+    """A day and month mentioned in the text, e.g. 31 January."""
+    day: int
+    month: str
+    context: str
+    type: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "day": self.day,
+            "month": self.month,
+            "context": self.context,
+            "type": self.type,
+        }
+
+
+@dataclass(slots=True)
 class ExtractedMetadata:
     """
     Metadata extracted from a document or chunk.
+    
+    to_dict() keeps the JSON shape of the plain dicts the records replaced.
     """
     # Monetary thresholds
-    thresholds: List[Dict[str, Any]] = field(default_factory=list)
-    # [{"value": 90000, "context": "VAT registration", "type": "registration"}]
+    thresholds: List[Threshold] = field(default_factory=list)
+    # [Threshold(value=90000, type="vat_registration", formatted="£90,000", ...)]
     
     # Tax years mentioned
     tax_years: List[str] = field(default_factory=list)
     # ["2024-25", "2023-24"]
     
     # Forms referenced
-    forms: List[Dict[str, str]] = field(default_factory=list)
-    # [{"code": "SA100", "name": "Self Assessment tax return"}]
+    forms: List[FormReference] = field(default_factory=list)
+    # [FormReference(code="SA100", name="Self Assessment tax return")]
     
     # Key dates
-    key_dates: List[Dict[str, Any]] = field(default_factory=list)
-    # [{"day": 31, "month": "January", "context": "Self Assessment deadline"}]
+    key_dates: List[KeyDate] = field(default_factory=list)
+    # [KeyDate(day=31, month="January", type="deadline", ...)]
     
     # Keywords for hybrid search
     keywords: List[str] = field(default_factory=list)
@@ -57,26 +134,45 @@ class ExtractedMetadata:
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "thresholds": self.thresholds,
+            "thresholds": [threshold.to_dict() for threshold in self.thresholds],
             "tax_years": self.tax_years,
-            "forms": self.forms,
-            "key_dates": self.key_dates,
+            "forms": [form.to_dict() for form in self.forms],
+            "key_dates": [key_date.to_dict() for key_date in self.key_dates],
             "keywords": self.keywords,
             "topics": self.topics,
             "business_types": self.business_types,
         }
     
     def merge(self, other: 'ExtractedMetadata') -> 'ExtractedMetadata':
-        """Merge two metadata objects."""
-        return ExtractedMetadata(
-            thresholds=self.thresholds + other.thresholds,
-            tax_years=list(set(self.tax_years + other.tax_years)),
-            forms=self.forms + other.forms,
-            key_dates=self.key_dates + other.key_dates,
-            keywords=list(set(self.keywords + other.keywords)),
-            topics=list(set(self.topics + other.topics)),
-            business_types=list(set(self.business_types + other.business_types)),
+        """Merge two metadata objects into a new one."""
+        return replace(self).merge_inplace(other)
+    
+    def merge_inplace(self, other: 'ExtractedMetadata') -> 'ExtractedMetadata':
+        """
+        Merge other into this object and return it.
+        
+        Thresholds are deduplicated on (value, type), forms on code and key
+        dates on (day, month); the first occurrence is kept. String lists
+        keep first-seen order. Fields are rebound to new lists, so lists
+        shared with other objects are never mutated.
+        """
+        self.thresholds = _dedup_records(
+            itertools.chain(self.thresholds, other.thresholds),
+            key=lambda t: (t.value, t.type)
         )
+        self.tax_years = list(dict.fromkeys(itertools.chain(self.tax_years, other.tax_years)))
+        self.forms = _dedup_records(
+            itertools.chain(self.forms, other.forms),
+            key=lambda f: f.code
+        )
+        self.key_dates = _dedup_records(
+            itertools.chain(self.key_dates, other.key_dates),
+            key=lambda d: (d.day, d.month)
+        )
+        self.keywords = list(dict.fromkeys(itertools.chain(self.keywords, other.keywords)))
+        self.topics = list(dict.fromkeys(itertools.chain(self.topics, other.topics)))
+        self.business_types = list(dict.fromkeys(itertools.chain(self.business_types, other.business_types)))
+        return self
 
 
 class MetadataExtractor(BaseExtractor):
@@ -84,8 +180,12 @@ class MetadataExtractor(BaseExtractor):
     Extracts structured metadata from UK tax documents.
     """
     
+    # Patterns stay on the stdlib re engine: gov.uk text is full of
+    # non-breaking spaces, which RE2's ASCII-only \s and \b do not match.
+    # Every pattern here is a linear scan with no nested repetition.
+    
     # Known UK tax thresholds with context patterns
-    THRESHOLD_PATTERNS = [
+    THRESHOLD_PATTERNS = (
         # VAT registration
         (re.compile(r'(?:VAT\s+)?registration\s+threshold[:\s]+£?([\d,]+)', re.I), 'vat_registration'),
         (re.compile(r'(?:taxable\s+)?turnover\s+(?:exceeds?|over|more\s+than)\s+£([\d,]+)', re.I), 'vat_registration'),
@@ -111,10 +211,14 @@ class MetadataExtractor(BaseExtractor):
         # Generic threshold
         (re.compile(r'threshold\s+(?:of|is)\s+£([\d,]+)', re.I), 'threshold'),
         (re.compile(r'£([\d,]+)\s+threshold', re.I), 'threshold'),
-    ]
+    )
+    
+    # Every THRESHOLD_PATTERNS match contains one of these words; text
+    # without any of them is not scanned at all
+    THRESHOLD_ANCHOR_WORDS = ('threshold', 'turnover', 'allowance', 'band', 'limit', 'profits')
     
     # Known forms
-    KNOWN_FORMS = {
+    KNOWN_FORMS = MappingProxyType({
         'SA100': 'Self Assessment tax return (main form)',
         'SA102': 'Employment income',
         'SA103': 'Self-employment (short)',
@@ -137,7 +241,11 @@ class MetadataExtractor(BaseExtractor):
         'RTI': 'Real Time Information',
         'FPS': 'Full Payment Submission',
         'EPS': 'Employer Payment Summary',
-    }
+    })
+    
+    # KNOWN_FORMS keyed the way _extract_forms normalises codes (upper
+    # case), so 'P11D(b)' is found as 'P11D(B)'
+    FORM_NAMES = MappingProxyType({code.upper(): name for code, name in KNOWN_FORMS.items()})
     
     # Form pattern
     FORM_PATTERN = re.compile(
@@ -145,38 +253,93 @@ class MetadataExtractor(BaseExtractor):
         re.I
     )
     
+    # FORM_PATTERN for lowercased text, without the leading \b. Starting
+    # with literals lets the scan skip ahead to candidate first letters;
+    # the leading word boundary is checked on each candidate instead.
+    FORM_CANDIDATE_PATTERN = re.compile(
+        r'(?:sa\d{2,3}[a-z]?|ct\d{3}[a-z]?|vat\d{1,3}|p\d{2}[a-z]?|p60|p45|p11d(?:\(b\))?|rti|fps|eps)\b'
+    )
+    
     # Tax year pattern
     TAX_YEAR_PATTERN = re.compile(r'(\d{4})[/-](\d{2,4})')
-    EXPLICIT_TAX_YEAR = re.compile(r'(?:tax\s+year|year)\s+(\d{4})[/-](\d{2,4})', re.I)
     
-    # Date patterns
-    DATE_PATTERNS = [
-        re.compile(r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)', re.I),
-    ]
+    # Month names for key dates, matched in lowercased text. A key date is
+    # a month name preceded by whitespace and a one or two digit day.
+    MONTH_NAMES = (
+        'january', 'february', 'march', 'april', 'may', 'june',
+        'july', 'august', 'september', 'october', 'november', 'december',
+    )
+    
+    # Date type by context words, checked in priority order ('pay' also
+    # covers 'payment')
+    DATE_TYPE_WORDS = (
+        ('deadline', ('deadline', 'due', 'submit', 'file')),
+        ('payment', ('pay',)),
+        ('start_date', ('start', 'begin', 'commence')),
+        ('end_date', ('end', 'finish', 'close')),
+    )
     
     # Topic keywords
-    TOPIC_KEYWORDS = {
-        'vat': ['vat', 'value added tax', 'vat registration', 'vat return', 'vat rate'],
-        'income_tax': ['income tax', 'paye', 'personal allowance', 'tax band', 'tax code'],
-        'corporation_tax': ['corporation tax', 'company tax', 'ct600', 'marginal relief'],
-        'self_assessment': ['self assessment', 'self-assessment', 'sa100', 'tax return'],
-        'national_insurance': ['national insurance', 'ni contributions', 'class 1', 'class 2', 'class 4'],
-        'capital_gains': ['capital gains', 'cgt', 'asset disposal', 'annual exempt amount'],
-        'paye': ['paye', 'employer', 'payroll', 'real time information', 'rti'],
-        'penalties': ['penalty', 'penalties', 'late filing', 'late payment', 'surcharge'],
-        'tax_credits': ['tax credits', 'working tax credit', 'child tax credit'],
-        'inheritance_tax': ['inheritance tax', 'iht', 'estate', 'nil rate band'],
-    }
+    TOPIC_KEYWORDS = MappingProxyType({
+        'vat': ('vat', 'value added tax', 'vat registration', 'vat return', 'vat rate'),
+        'income_tax': ('income tax', 'paye', 'personal allowance', 'tax band', 'tax code'),
+        'corporation_tax': ('corporation tax', 'company tax', 'ct600', 'marginal relief'),
+        'self_assessment': ('self assessment', 'self-assessment', 'sa100', 'tax return'),
+        'national_insurance': ('national insurance', 'ni contributions', 'class 1', 'class 2', 'class 4'),
+        'capital_gains': ('capital gains', 'cgt', 'asset disposal', 'annual exempt amount'),
+        'paye': ('paye', 'employer', 'payroll', 'real time information', 'rti'),
+        'penalties': ('penalty', 'penalties', 'late filing', 'late payment', 'surcharge'),
+        'tax_credits': ('tax credits', 'working tax credit', 'child tax credit'),
+        'inheritance_tax': ('inheritance tax', 'iht', 'estate', 'nil rate band'),
+    })
     
     # Business type keywords
-    BUSINESS_TYPE_KEYWORDS = {
-        'sole_trader': ['sole trader', 'self-employed', 'self employed', 'freelancer'],
-        'limited_company': ['limited company', 'ltd', 'company director', 'corporation'],
-        'partnership': ['partnership', 'partner', 'llp'],
-        'contractor': ['contractor', 'ir35', 'off-payroll'],
-        'landlord': ['landlord', 'property income', 'rental income', 'buy to let'],
-        'employer': ['employer', 'employee', 'paye', 'payroll'],
-    }
+    BUSINESS_TYPE_KEYWORDS = MappingProxyType({
+        'sole_trader': ('sole trader', 'self-employed', 'self employed', 'freelancer'),
+        'limited_company': ('limited company', 'ltd', 'company director', 'corporation'),
+        'partnership': ('partnership', 'partner', 'llp'),
+        'contractor': ('contractor', 'ir35', 'off-payroll'),
+        'landlord': ('landlord', 'property income', 'rental income', 'buy to let'),
+        'employer': ('employer', 'employee', 'paye', 'payroll'),
+    })
+    
+    # Every distinct topic/business keyword, probed once per document
+    ALL_KEYWORDS = tuple(dict.fromkeys(
+        keyword
+        for keywords in (*TOPIC_KEYWORDS.values(), *BUSINESS_TYPE_KEYWORDS.values())
+        for keyword in keywords
+    ))
+    
+    # Keyword -> topics / business types, so classification only visits
+    # the groups of keywords that were actually found
+    KEYWORD_TOPICS = _invert_keywords(TOPIC_KEYWORDS)
+    KEYWORD_BUSINESS_TYPES = _invert_keywords(BUSINESS_TYPE_KEYWORDS)
+    
+    # Chunk results keyed by content digest; boilerplate chunks (footers,
+    # definitions) repeat across gov.uk documents. Entries are tuples of
+    # the ExtractedMetadata fields, so they can't be changed through a
+    # returned object. Bounded by the characters the records hold as well
+    # as by count, since one chunk can carry many thresholds and dates.
+    CHUNK_CACHE_SIZE = 4096
+    CHUNK_CACHE_MAX_CHARS = 8 * 1024 * 1024
+    _chunk_cache: 'OrderedDict[bytes, Tuple[int, Tuple[Tuple[Any, ...], ...]]]' = OrderedDict()
+    _chunk_cache_chars = 0
+    _chunk_cache_lock = threading.Lock()
+    
+    # Below this many uncached chunks, worker start-up costs more than it
+    # saves
+    PARALLEL_MIN_CHUNKS = 256
+    
+    # extract_streaming re-scans this much of the previous window, enough
+    # for a match plus its surrounding context
+    STREAM_OVERLAP = 250
+    WHITESPACE_PATTERN = re.compile(r'\s')
+    
+    # First THRESHOLD_PATTERNS index of each threshold type
+    THRESHOLD_TYPE_PRIORITY = MappingProxyType({
+        threshold_type: index
+        for index, (_, threshold_type) in reversed(list(enumerate(THRESHOLD_PATTERNS)))
+    })
     
     def __init__(self):
         super().__init__()
@@ -197,27 +360,34 @@ class MetadataExtractor(BaseExtractor):
         
         try:
             metadata = ExtractedMetadata()
+            text_lower = self.lowercase_text(text_content)
             
             # Extract thresholds
-            metadata.thresholds = self._extract_thresholds(text_content)
+            metadata.thresholds = self._extract_thresholds(text_content, text_lower)
             
             # Extract tax years
-            metadata.tax_years = self._extract_tax_years(text_content)
+            metadata.tax_years = self._extract_tax_years(text_lower)
+            
+            # One form scan feeds forms and keywords
+            form_matches = self._scan_forms(text_content, text_lower)
             
             # Extract forms
-            metadata.forms = self._extract_forms(text_content)
+            metadata.forms = self._extract_forms(form_matches)
             
             # Extract key dates
-            metadata.key_dates = self._extract_key_dates(text_content)
+            metadata.key_dates = self._extract_key_dates(text_content, text_lower)
+            
+            # One keyword scan feeds keywords, topics and business types
+            found_keywords = self._scan_keywords(text_lower)
             
             # Extract keywords
-            metadata.keywords = self._extract_keywords(text_content)
+            metadata.keywords = self._extract_keywords(found_keywords, form_matches)
             
             # Classify topics
-            metadata.topics = self._classify_topics(text_content)
+            metadata.topics = self._classify_topics(found_keywords)
             
             # Identify business types
-            metadata.business_types = self._identify_business_types(text_content)
+            metadata.business_types = self._identify_business_types(found_keywords)
             
             result.items.append(metadata)
             logger.info(f"Extracted metadata: {len(metadata.thresholds)} thresholds, {len(metadata.forms)} forms")
@@ -228,184 +398,461 @@ class MetadataExtractor(BaseExtractor):
         
         return result
     
-    def _extract_thresholds(self, text: str) -> List[Dict[str, Any]]:
-        """Extract monetary thresholds."""
+    def _extract_thresholds(
+        self,
+        text: str,
+        text_lower: str,
+        complete_context_only: bool = False
+    ) -> List[Threshold]:
+        """
+        Extract monetary thresholds.
+        
+        Args:
+            text: Text to scan
+            text_lower: lowercase_text(text)
+            complete_context_only: Skip thresholds whose context is cut
+                short by the end of text
+        """
+        if not any(word in text_lower for word in self.THRESHOLD_ANCHOR_WORDS):
+            return []
+        
+        # Rate tables repeat the same amounts, so parse each string once
+        parsed: Dict[str, Optional[int]] = {}
+        seen_values: Set[int] = set()
         thresholds = []
-        seen_values = set()
+        text_length = len(text)
         
         for pattern, threshold_type in self.THRESHOLD_PATTERNS:
             for match in pattern.finditer(text):
-                try:
-                    value = int(match.group(1).replace(',', ''))
-                    
-                    # Skip duplicates
-                    if value in seen_values:
-                        continue
-                    seen_values.add(value)
-                    
-                    # Get context
-                    context_start = max(0, match.start() - 50)
-                    context_end = min(len(text), match.end() + 50)
-                    context = text[context_start:context_end]
-                    
-                    thresholds.append({
-                        "value": value,
-                        "type": threshold_type,
-                        "context": context,
-                        "formatted": f"£{value:,}"
-                    })
-                except ValueError:
+                amount = match.group(1)
+                if amount in parsed:
+                    value = parsed[amount]
+                else:
+                    try:
+                        value = int(amount.replace(',', ''))
+                    except ValueError:
+                        value = None
+                    parsed[amount] = value
+                
+                # Skip duplicates
+                if value is None or value in seen_values:
                     continue
+                seen_values.add(value)
+                
+                # Get context
+                context_start = max(0, match.start() - 50)
+                context_end = min(text_length, match.end() + 50)
+                if complete_context_only and context_end == text_length:
+                    continue
+                
+                thresholds.append(Threshold(
+                    value=value,
+                    type=threshold_type,
+                    context=text[context_start:context_end],
+                    formatted=f"£{value:,}"
+                ))
         
         return thresholds
     
-    def _extract_tax_years(self, text: str) -> List[str]:
+    def _extract_tax_years(self, text_lower: str) -> List[str]:
         """Extract tax years mentioned."""
         years = set()
         
-        # Explicit tax year mentions first
-        for match in self.EXPLICIT_TAX_YEAR.finditer(text):
+        for match in self.TAX_YEAR_PATTERN.finditer(text_lower):
             year1 = match.group(1)
             year2 = match.group(2)
+            
+            # Explicit mentions ("tax year 2024-25") are taken as written;
+            # anything else must look like a tax year, not a date range
+            if not self._follows_year_word(text_lower, match.start()):
+                y1 = int(year1)
+                y2 = int(year2) % 100
+                
+                # Tax year spans two calendar years (e.g., 2024-25)
+                if y2 != (y1 + 1) % 100:
+                    continue
+            
             if len(year2) == 4:
                 year2 = year2[2:]
             years.add(f"{year1}-{year2}")
         
-        # General tax year pattern
-        for match in self.TAX_YEAR_PATTERN.finditer(text):
-            year1 = match.group(1)
-            year2 = match.group(2)
+        return sorted(years, reverse=True)
+    
+    def _follows_year_word(self, text_lower: str, start: int) -> bool:
+        """Whether text_lower[start] is preceded by 'year' and whitespace."""
+        word_end = start
+        while word_end > 0 and text_lower[word_end - 1].isspace():
+            word_end -= 1
+        return word_end < start and text_lower[word_end - 4:word_end] == 'year'
+    
+    def _scan_forms(self, text: str, text_lower: str) -> List[str]:
+        """Return form references as written in text, in document order."""
+        form_matches = []
+        
+        for match in self.FORM_CANDIDATE_PATTERN.finditer(text_lower):
+            start = match.start()
             
-            # Validate it looks like a tax year (not a date range)
-            y1 = int(year1)
-            y2 = int(year2) if len(year2) == 2 else int(year2) % 100
+            # Leading word boundary
+            if start and (text_lower[start - 1].isalnum() or text_lower[start - 1] == '_'):
+                continue
             
-            # Tax year spans two calendar years (e.g., 2024-25)
-            if y2 == (y1 + 1) % 100:
-                if len(year2) == 4:
-                    year2 = year2[2:]
-                years.add(f"{year1}-{year2}")
+            form_matches.append(text[start:match.end()])
         
-        return sorted(list(years), reverse=True)
+        return form_matches
     
-    def _extract_forms(self, text: str) -> List[Dict[str, str]]:
+    def _extract_forms(self, form_matches: List[str]) -> List[FormReference]:
         """Extract form references."""
         forms = []
         seen = set()
         
-        for match in self.FORM_PATTERN.finditer(text):
-            form_code = match.group(1).upper()
+        for form_match in form_matches:
+            form_code = form_match.upper()
             
             if form_code in seen:
                 continue
             seen.add(form_code)
             
-            forms.append({
-                "code": form_code,
-                "name": self.KNOWN_FORMS.get(form_code, "HMRC form"),
-            })
+            forms.append(FormReference(
+                code=form_code,
+                name=self.FORM_NAMES.get(form_code, "HMRC form"),
+            ))
         
         return forms
     
-    def _extract_key_dates(self, text: str) -> List[Dict[str, Any]]:
-        """Extract key dates (deadlines, etc.)."""
+    def _extract_key_dates(
+        self,
+        text: str,
+        text_lower: str,
+        complete_context_only: bool = False
+    ) -> List[KeyDate]:
+        """
+        Extract key dates (deadlines, etc.).
+        
+        Args:
+            text: Text to scan
+            text_lower: lowercase_text(text)
+            complete_context_only: Skip dates whose context is cut short by
+                the end of text
+        """
         dates = []
         seen = set()
         
-        for pattern in self.DATE_PATTERNS:
-            for match in pattern.finditer(text):
-                day = int(match.group(1))
-                month = match.group(2).capitalize()
-                
-                key = (day, month)
-                if key in seen:
-                    continue
-                seen.add(key)
-                
-                # Get context to understand what the date is for
-                context_start = max(0, match.start() - 100)
-                context_end = min(len(text), match.end() + 50)
-                context = text[context_start:context_end]
-                
-                # Determine date type from context
-                date_type = self._classify_date_type(context)
-                
-                dates.append({
-                    "day": day,
-                    "month": month,
-                    "context": context,
-                    "type": date_type,
-                })
+        # Month names are rare, so find them first and only then look back
+        # for the day number
+        month_starts = []
+        for month in self.MONTH_NAMES:
+            index = text_lower.find(month)
+            while index != -1:
+                month_starts.append((index, month))
+                index = text_lower.find(month, index + len(month))
+        month_starts.sort()
+        
+        for month_start, month in month_starts:
+            # At least one whitespace character before the month...
+            day_end = month_start
+            while day_end > 0 and text_lower[day_end - 1].isspace():
+                day_end -= 1
+            if day_end == month_start:
+                continue
+            
+            # ...and one or two digits before that
+            day_start = day_end
+            while day_start > day_end - 2 and day_start > 0 and text_lower[day_start - 1].isdecimal():
+                day_start -= 1
+            if day_start == day_end:
+                continue
+            
+            day = int(text_lower[day_start:day_end])
+            month_name = month.capitalize()
+            
+            key = (day, month_name)
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            # Get context to understand what the date is for
+            context_start = max(0, day_start - 100)
+            context_end = min(len(text), month_start + len(month) + 50)
+            if complete_context_only and context_end == len(text):
+                continue
+            
+            # Determine date type from context
+            date_type = self._classify_date_type(text_lower[context_start:context_end])
+            
+            dates.append(KeyDate(
+                day=day,
+                month=month_name,
+                context=text[context_start:context_end],
+                type=date_type,
+            ))
         
         return dates
     
-    def _classify_date_type(self, context: str) -> str:
-        """Classify what type of date this is."""
-        context_lower = context.lower()
-        
-        if any(w in context_lower for w in ['deadline', 'due', 'submit', 'file']):
-            return 'deadline'
-        elif any(w in context_lower for w in ['pay', 'payment']):
-            return 'payment'
-        elif any(w in context_lower for w in ['start', 'begin', 'commence']):
-            return 'start_date'
-        elif any(w in context_lower for w in ['end', 'finish', 'close']):
-            return 'end_date'
+    def _classify_date_type(self, context_lower: str) -> str:
+        """Classify what type of date this is from its lowercased context."""
+        for date_type, words in self.DATE_TYPE_WORDS:
+            for word in words:
+                if word in context_lower:
+                    return date_type
         
         return 'date'
     
-    def _extract_keywords(self, text: str) -> List[str]:
+    def _scan_keywords(self, text_lower: str) -> Set[str]:
+        """Return the topic/business keywords contained in lowercased text."""
+        return {keyword for keyword in self.ALL_KEYWORDS if keyword in text_lower}
+    
+    def _extract_keywords(self, found_keywords: Set[str], form_matches: List[str]) -> List[str]:
         """Extract keywords for hybrid search."""
-        keywords = set()
-        text_lower = text.lower()
-        
-        # Add topic keywords found
-        for topic, topic_keywords in self.TOPIC_KEYWORDS.items():
-            for keyword in topic_keywords:
-                if keyword in text_lower:
-                    keywords.add(keyword)
-        
-        # Add business type keywords
-        for btype, btype_keywords in self.BUSINESS_TYPE_KEYWORDS.items():
-            for keyword in btype_keywords:
-                if keyword in text_lower:
-                    keywords.add(keyword)
+        # Topic and business type keywords found
+        keywords = set(found_keywords)
         
         # Add form codes
-        for match in self.FORM_PATTERN.finditer(text):
-            keywords.add(match.group(1).lower())
+        for form_match in form_matches:
+            keywords.add(form_match.lower())
         
         return sorted(list(keywords))
     
-    def _classify_topics(self, text: str) -> List[str]:
+    def _classify_topics(self, found_keywords: Set[str]) -> List[str]:
         """Classify document topics based on keywords."""
-        topics = []
-        text_lower = text.lower()
+        # Count keyword matches per topic
+        matches: Dict[str, int] = {}
+        for kw in found_keywords:
+            for topic in self.KEYWORD_TOPICS.get(kw, ()):
+                matches[topic] = matches.get(topic, 0) + 1
         
-        for topic, keywords in self.TOPIC_KEYWORDS.items():
-            # Count keyword matches
-            matches = sum(1 for kw in keywords if kw in text_lower)
-            if matches >= 2:  # Require at least 2 keyword matches
-                topics.append(topic)
-        
-        return topics
+        # Require at least 2 keyword matches
+        return [topic for topic in self.TOPIC_KEYWORDS if matches.get(topic, 0) >= 2]
     
-    def _identify_business_types(self, text: str) -> List[str]:
+    def _identify_business_types(self, found_keywords: Set[str]) -> List[str]:
         """Identify what business types this content applies to."""
-        types = []
-        text_lower = text.lower()
-        
-        for btype, keywords in self.BUSINESS_TYPE_KEYWORDS.items():
-            if any(kw in text_lower for kw in keywords):
-                types.append(btype)
+        found_types = {
+            btype
+            for kw in found_keywords
+            for btype in self.KEYWORD_BUSINESS_TYPES.get(kw, ())
+        }
         
-        return types
+        return [btype for btype in self.BUSINESS_TYPE_KEYWORDS if btype in found_types]
     
     def extract_for_chunk(self, chunk_text: str) -> ExtractedMetadata:
         """
         Simplified extraction for individual chunks.
         
-        Returns metadata directly rather than ExtractionResult.
+        Returns metadata directly rather than ExtractionResult. Results are
+        cached by content, and every call gets its own lists (the records
+        in them are frozen, so sharing those is safe).
+        """
+        if not chunk_text:
+            return ExtractedMetadata()
+        
+        key = self._chunk_key(chunk_text)
+        entry = self._cached_chunk(key)
+        if entry is None:
+            entry = self._chunk_entry(chunk_text)
+            self._cache_chunk(key, entry)
+        
+        return ExtractedMetadata(*map(list, entry[1]))
+    
+    def _chunk_key(self, chunk_text: str) -> bytes:
+        """Chunk cache key: a digest of the chunk text."""
+        return hashlib.blake2b(
+            chunk_text.encode('utf-8', 'surrogatepass'), digest_size=16
+        ).digest()
+    
+    def _cached_chunk(self, key: bytes) -> Optional[Tuple[int, Tuple[Tuple[Any, ...], ...]]]:
+        """Look up a chunk cache entry, marking it as recently used."""
+        cache = self._chunk_cache
+        with self._chunk_cache_lock:
+            entry = cache.get(key)
+            if entry is not None:
+                cache.move_to_end(key)
+        return entry
+    
+    def _chunk_entry(self, chunk_text: str) -> Tuple[int, Tuple[Tuple[Any, ...], ...]]:
+        """
+        Extract one chunk into a cache entry, without touching the cache.
+        
+        Entries are (characters held, ExtractedMetadata field values).
         """
         result = self.extract(None, chunk_text, "")
-        return result.items[0] if result.items else ExtractedMetadata()
+        metadata = result.items[0] if result.items else ExtractedMetadata()
+        return (
+            self._metadata_chars(metadata),
+            tuple(tuple(getattr(metadata, f.name)) for f in fields(metadata)),
+        )
+    
+    def _cache_chunk(self, key: bytes, entry: Tuple[int, Tuple[Tuple[Any, ...], ...]]) -> None:
+        """Store a chunk cache entry, evicting the oldest past either bound."""
+        if entry[0] > self.CHUNK_CACHE_MAX_CHARS:
+            return
+        
+        cache = self._chunk_cache
+        with self._chunk_cache_lock:
+            # The counter lives on MetadataExtractor itself, next to the
+            # shared cache, whatever class this is called through
+            replaced = cache.pop(key, None)
+            if replaced is not None:
+                MetadataExtractor._chunk_cache_chars -= replaced[0]
+            cache[key] = entry
+            MetadataExtractor._chunk_cache_chars += entry[0]
+            while (len(cache) > self.CHUNK_CACHE_SIZE
+                    or MetadataExtractor._chunk_cache_chars > self.CHUNK_CACHE_MAX_CHARS):
+                _, evicted = cache.popitem(last=False)
+                MetadataExtractor._chunk_cache_chars -= evicted[0]
+    
+    @staticmethod
+    def _metadata_chars(metadata: ExtractedMetadata) -> int:
+        """Characters of text held by one chunk's metadata."""
+        return (
+            sum(len(t.context) + len(t.formatted) for t in metadata.thresholds)
+            + sum(len(f.code) + len(f.name) for f in metadata.forms)
+            + sum(len(d.context) for d in metadata.key_dates)
+            + sum(len(value) for value in itertools.chain(
+                metadata.tax_years, metadata.keywords, metadata.topics, metadata.business_types
+            ))
+        )
+    
+    def extract_streaming(self, text_iter: Iterable[str]) -> ExtractedMetadata:
+        """
+        Extract metadata from a document supplied as consecutive pieces.
+        
+        Meant for very large documents: only a window of the text is
+        lowercased and scanned at a time. Windows end at whitespace, so no
+        token is cut in half, and each one starts STREAM_OVERLAP characters
+        back into the previous window. Records seen twice in the overlap
+        are merged away, and topics and business types are classified from
+        the keywords of the whole document. The result matches extract()
+        except for record order, and a threshold's context may come from
+        another mention of the same value and type.
+        
+        Args:
+            text_iter: Pieces of the document, in order
+        
+        Returns:
+            Metadata for the whole document
+        """
+        metadata = ExtractedMetadata()
+        found_keywords: Set[str] = set()
+        carry = ""
+        
+        for piece in text_iter:
+            carry += piece
+            
+            # Scan up to the last whitespace; the partial token after it
+            # waits for the next piece
+            scan_end = len(carry)
+            while scan_end > 0 and not carry[scan_end - 1].isspace():
+                scan_end -= 1
+            if scan_end == 0:
+                continue
+            
+            self._extract_window(carry[:scan_end], metadata, found_keywords, final=False)
+            
+            # Keep the overlap, starting at whitespace; carry[scan_end - 1]
+            # is whitespace, so the search always matches
+            if scan_end > self.STREAM_OVERLAP:
+                overlap_start = self.WHITESPACE_PATTERN.search(
+                    carry, scan_end - self.STREAM_OVERLAP
+                ).start()
+                carry = carry[overlap_start:]
+        
+        if carry:
+            self._extract_window(carry, metadata, found_keywords, final=True)
+        
+        # One threshold per value, as extract() keeps it: the type of the
+        # earliest THRESHOLD_PATTERNS entry wins
+        priority = self.THRESHOLD_TYPE_PRIORITY
+        best: Dict[int, Threshold] = {}
+        for threshold in metadata.thresholds:
+            current = best.get(threshold.value)
+            if current is None or priority[threshold.type] < priority[current.type]:
+                best[threshold.value] = threshold
+        metadata.thresholds = sorted(best.values(), key=lambda t: priority[t.type])
+        
+        # Windows were merged in first-seen order; extract() sorts these
+        metadata.tax_years.sort(reverse=True)
+        metadata.keywords.sort()
+        
+        metadata.topics = self._classify_topics(found_keywords)
+        metadata.business_types = self._identify_business_types(found_keywords)
+        
+        return metadata
+    
+    def _extract_window(
+        self,
+        window: str,
+        metadata: ExtractedMetadata,
+        found_keywords: Set[str],
+        final: bool
+    ) -> None:
+        """Scan one extract_streaming window into metadata."""
+        window_lower = self.lowercase_text(window)
+        form_matches = self._scan_forms(window, window_lower)
+        window_keywords = self._scan_keywords(window_lower)
+        found_keywords |= window_keywords
+        
+        # Before the last window, records whose context runs into the window
+        # end are left out; the next window starts far enough back to see
+        # them again in full
+        metadata.merge_inplace(ExtractedMetadata(
+            thresholds=self._extract_thresholds(window, window_lower, complete_context_only=not final),
+            tax_years=self._extract_tax_years(window_lower),
+            forms=self._extract_forms(form_matches),
+            key_dates=self._extract_key_dates(window, window_lower, complete_context_only=not final),
+            keywords=self._extract_keywords(window_keywords, form_matches),
+        ))
+    
+    def extract_for_chunks_batch(
+        self,
+        chunks: List[str],
+        workers: Optional[int] = None
+    ) -> List[ExtractedMetadata]:
+        """
+        Run extract_for_chunk over many chunks, in worker processes for
+        large batches.
+        
+        The chunk cache is checked here first. Each distinct chunk that
+        misses is extracted once, through map_in_processes, and its result
+        is cached in this process.
+        
+        Args:
+            chunks: Chunk texts
+            workers: Number of worker processes (default: CPU count)
+        
+        Returns:
+            One ExtractedMetadata per chunk, in input order
+        """
+        results: List[Optional[ExtractedMetadata]] = [None] * len(chunks)
+        missing: Dict[bytes, List[int]] = {}
+        
+        for index, chunk_text in enumerate(chunks):
+            if not chunk_text:
+                results[index] = ExtractedMetadata()
+                continue
+            key = self._chunk_key(chunk_text)
+            entry = self._cached_chunk(key)
+            if entry is None:
+                missing.setdefault(key, []).append(index)
+            else:
+                results[index] = ExtractedMetadata(*map(list, entry[1]))
+        
+        keys = list(missing)
+        entries = self.map_in_processes(
+            self._chunk_entry,
+            [chunks[missing[key][0]] for key in keys],
+            workers=workers,
+            min_items=self.PARALLEL_MIN_CHUNKS,
+            chunksize=64
+        )
+        for key, entry in zip(keys, entries):
+            self._cache_chunk(key, entry)
+            for index in missing[key]:
+                results[index] = ExtractedMetadata(*map(list, entry[1]))
+        
+        return results
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached chunk metadata."""
+        with cls._chunk_cache_lock:
+            cls._chunk_cache.clear()
+            MetadataExtractor._chunk_cache_chars = 0
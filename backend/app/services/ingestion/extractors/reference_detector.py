@@ -12,8 +12,9 @@ Key Features:
 - Internal GOV.UK links
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import logging
 
@@ -22,7 +23,18 @@ from .base import BaseExtractor, ExtractionResult
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _alternation(patterns: List[Tuple[re.Pattern, str]]) -> re.Pattern:
+    """
+    Join single-group patterns into one alternation scanned in a single pass.
+    
+    match.lastindex is the position of the matching pattern in the list (from
+    1). Only for patterns that never match overlapping text, as the
+    alternation reports the leftmost match alone.
+    """
+    return re.compile('|'.join(f'(?:{pattern.pattern})' for pattern, _ in patterns), re.I)
+
+
+@dataclass(slots=True)
 class DetectedReference:
     """Represents a cross-reference detected in text."""
     
@@ -67,28 +79,50 @@ class ReferenceDetector(BaseExtractor):
     5. Internal GOV.UK Links (/guidance/vat-registration)
     """
     
-    # HMRC manual section patterns
-    HMRC_MANUAL_PATTERNS = [
+    # Compiled with stdlib re rather than RE2: GOV.UK writes "section 3.2"
+    # and "Finance Act 2024" with non-breaking spaces, which only Unicode \s
+    # matches, and none of these patterns can backtrack superlinearly.
+    
+    # HMRC manual prefixes, each followed by a five digit section number
+    HMRC_MANUAL_PREFIXES = [
         # VAT manuals
-        (re.compile(r'\b(VAT(?:REG|SC|TOS|INF|IT|NOT|POSS|FRS|REC|AOS|GEN|ADJ|PE|RA|SG|AM|DT|LAND|FIN|FS)\d{5})\b', re.I), 'vat_manual'),
+        (r'VAT(?:REG|SC|TOS|INF|IT|NOT|POSS|FRS|REC|AOS|GEN|ADJ|PE|RA|SG|AM|DT|LAND|FIN|FS)', 'vat_manual'),
         # Corporation Tax Manual
-        (re.compile(r'\b(CTM\d{5})\b', re.I), 'ct_manual'),
+        (r'CTM', 'ct_manual'),
         # Capital Gains Manual
-        (re.compile(r'\b(CG\d{5})\b', re.I), 'cg_manual'),
+        (r'CG', 'cg_manual'),
         # Business Income Manual
-        (re.compile(r'\b(BIM\d{5})\b', re.I), 'bim_manual'),
+        (r'BIM', 'bim_manual'),
         # Employment Income Manual
-        (re.compile(r'\b(EIM\d{5})\b', re.I), 'eim_manual'),
+        (r'EIM', 'eim_manual'),
         # National Insurance Manual
-        (re.compile(r'\b(NIM\d{5})\b', re.I), 'ni_manual'),
+        (r'NIM', 'ni_manual'),
         # PAYE Manual
-        (re.compile(r'\b(PAYE\d{5})\b', re.I), 'paye_manual'),
+        (r'PAYE', 'paye_manual'),
         # Compliance Handbook
-        (re.compile(r'\b(CH\d{5})\b', re.I), 'compliance_handbook'),
+        (r'CH', 'compliance_handbook'),
         # Trusts Manual
-        (re.compile(r'\b(TSEM\d{5})\b', re.I), 'trusts_manual'),
+        (r'TSEM', 'trusts_manual'),
     ]
     
+    # HMRC manual section patterns
+    HMRC_MANUAL_PATTERNS = [
+        (re.compile(rf'\b({prefix}\d{{5}})\b', re.I), manual_type)
+        for prefix, manual_type in HMRC_MANUAL_PREFIXES
+    ]
+    
+    # Any manual code as a whole word; match.lastindex indexes
+    # HMRC_MANUAL_PREFIXES (from 1)
+    HMRC_MANUAL_PATTERN = re.compile(
+        r'\b(?:' + '|'.join(rf'({prefix}\d{{5}})' for prefix, _ in HMRC_MANUAL_PREFIXES) + r')\b',
+        re.I
+    )
+    
+    # Every manual code ends in a run of exactly five digits, far rarer in
+    # prose than the prefix letters, so the scan looks for the number first
+    MANUAL_NUMBER_PATTERN = re.compile(r'\d{5}\b')
+    MANUAL_PREFIX_MAX_LEN = 7  # VATPOSS, VATLAND
+    
     # Section/paragraph reference patterns
     SECTION_PATTERNS = [
         (re.compile(r'(?:see|refer\s+to)\s+(?:section|paragraph|para\.?)\s+([\d.]+)', re.I), 'section_ref'),
@@ -96,7 +130,18 @@ class ReferenceDetector(BaseExtractor):
         (re.compile(r'(?:section|paragraph|para\.?)\s+([\d.]+)\s+(?:above|below|explains?)', re.I), 'section_ref'),
     ]
     
-    # Legislation patterns
+    # Where two section patterns overlap they capture the same number, so the
+    # alternation loses nothing deduplication would keep
+    SECTION_PATTERN = _alternation(SECTION_PATTERNS)
+    
+    # Literals (in lowercase text) that every pattern of a group needs; a
+    # document with none of its group's anchors skips that group's scans
+    SECTION_ANCHORS = ('section', 'para')
+    LEGISLATION_ANCHORS = ('act', '/')
+    DEFINITION_ANCHORS = ('mean', 'defined')
+    
+    # Legislation patterns, scanned one by one: an act section reference
+    # also contains the act reference itself
     LEGISLATION_PATTERNS = [
         # UK Acts
         (re.compile(r'((?:Finance|Tax(?:es)?|VAT|Income\s+Tax|Corporation\s+Tax)\s+Act\s+\d{4})', re.I), 'uk_act'),
@@ -108,20 +153,30 @@ class ReferenceDetector(BaseExtractor):
         (re.compile(r'(?:EU\s+)?(?:Regulation|Directive)\s+(\d+/\d+)', re.I), 'eu_regulation'),
     ]
     
-    # Definition reference patterns
+    # Definition reference patterns, scanned one by one as a quoted term can
+    # fall inside another pattern's match
     DEFINITION_PATTERNS = [
         (re.compile(r'[\'"]([^\'\"]+)[\'"]\s+(?:as\s+defined|has\s+the\s+meaning|means)', re.I), 'definition'),
         (re.compile(r'(?:the\s+term\s+)?[\'"]([^\'\"]+)[\'"]\s+is\s+defined\s+in', re.I), 'definition'),
         (re.compile(r'(?:within\s+the\s+meaning\s+of)\s+([^,.]+)', re.I), 'definition'),
     ]
     
+    # The plainest signs of a reference, for has_references(), matched in
+    # lowercase text. Kept apart so each runs only when its anchor words
+    # are present.
+    SECTION_HINT_PATTERN = re.compile(r'(?:see|refer\s+to)\s+(?:section|paragraph)')
+    LEGISLATION_HINT_PATTERN = re.compile(r'(?:finance|tax)\s+act\s+\d{4}')
+    
     # Internal GOV.UK link patterns
     GOVUK_LINK_PATTERNS = [
         (re.compile(r'(?:gov\.uk|GOV\.UK)(/[a-z0-9\-/]+)', re.I), 'govuk_link'),
         (re.compile(r'(?:see|visit|go\s+to)\s+(?:the\s+)?([a-z\-]+)\s+(?:page|guidance|section)\s+on\s+GOV\.UK', re.I), 'govuk_page'),
     ]
     
-    # HMRC manual URL bases
+    # Manual section pages all live directly under this path
+    MANUAL_URL_ROOT = 'https://www.gov.uk/hmrc-internal-manuals/'
+    
+    # HMRC manual URL bases (only manuals listed here get a URL)
     MANUAL_URL_BASES = {
         'vat_manual': 'https://www.gov.uk/hmrc-internal-manuals/vat-',
         'ct_manual': 'https://www.gov.uk/hmrc-internal-manuals/company-taxation-manual/',
@@ -132,6 +187,13 @@ class ReferenceDetector(BaseExtractor):
         'paye_manual': 'https://www.gov.uk/hmrc-internal-manuals/paye-manual/',
     }
     
+    # Link detection builds only <a> elements and their contents, rather
+    # than the whole document tree
+    LINK_STRAINER = SoupStrainer('a')
+    
+    # Below this many documents, worker start-up costs more than it saves
+    PARALLEL_MIN_DOCUMENTS = 16
+    
     def __init__(self):
         super().__init__()
     
@@ -149,17 +211,22 @@ class ReferenceDetector(BaseExtractor):
             return result
         
         try:
+            text_lower = self.lowercase_text(text_content)
+            
             # Detect HMRC manual references
-            result.items.extend(self._detect_hmrc_references(text_content))
+            result.items.extend(self._detect_hmrc_references(text_content, text_lower))
             
             # Detect section references
-            result.items.extend(self._detect_section_references(text_content))
+            if any(anchor in text_lower for anchor in self.SECTION_ANCHORS):
+                result.items.extend(self._detect_section_references(text_content))
             
             # Detect legislation references
-            result.items.extend(self._detect_legislation_references(text_content))
+            if any(anchor in text_lower for anchor in self.LEGISLATION_ANCHORS):
+                result.items.extend(self._detect_legislation_references(text_content))
             
             # Detect definition references
-            result.items.extend(self._detect_definition_references(text_content))
+            if any(anchor in text_lower for anchor in self.DEFINITION_ANCHORS):
+                result.items.extend(self._detect_definition_references(text_content))
             
             # Detect GOV.UK links
             if html_content:
@@ -175,64 +242,120 @@ class ReferenceDetector(BaseExtractor):
         
         return result
     
-    def _detect_hmrc_references(self, text: str) -> List[DetectedReference]:
-        """Detect HMRC manual references."""
-        refs = []
+    def extract_batch(
+        self,
+        documents: List[Tuple[Optional[str], str, str]],
+        workers: Optional[int] = None
+    ) -> List[ExtractionResult[DetectedReference]]:
+        """
+        Run extract over many documents, in worker processes for large
+        batches (see map_in_processes).
         
-        for pattern, manual_type in self.HMRC_MANUAL_PATTERNS:
-            for match in pattern.finditer(text):
-                ref_text = match.group(1).upper()
-                
-                # Get context
-                context_start = max(0, match.start() - 50)
-                context_end = min(len(text), match.end() + 50)
-                context = text[context_start:context_end]
-                
-                # Determine relationship type from context
-                relationship = self._infer_relationship(context)
-                
-                # Try to construct URL
-                target_url = self._construct_manual_url(ref_text, manual_type)
-                
-                refs.append(DetectedReference(
-                    reference_type='hmrc_manual',
-                    reference_text=ref_text,
-                    target_normalized=ref_text.lower(),
-                    target_url=target_url,
-                    context=context,
-                    position=match.start(),
-                    relationship_type=relationship,
-                    strength='explicit',
-                ))
+        Args:
+            documents: (html_content, text_content, source_url) per document
+            workers: Number of worker processes (default: CPU count)
         
-        return refs
+        Returns:
+            One ExtractionResult per document, in input order
+        """
+        html_contents, text_contents, source_urls = zip(*documents) if documents else ((), (), ())
+        return self.map_in_processes(
+            self.extract, html_contents, text_contents, source_urls,
+            workers=workers,
+            min_items=self.PARALLEL_MIN_DOCUMENTS
+        )
+    
+    def _detect_hmrc_references(self, text: str, text_lower: str) -> List[DetectedReference]:
+        """
+        Detect HMRC manual references, first occurrence of each code only.
+        
+        Args:
+            text: Document text
+            text_lower: lowercase_text(text), from which relationship
+                contexts are sliced without lowercasing each one again
+        """
+        # One dict per manual, so references come out grouped by manual as
+        # they did when each manual was scanned separately. Repeats of a code
+        # are skipped before any work is done on them, as deduplication
+        # would drop them anyway.
+        refs_by_manual = [{} for _ in self.HMRC_MANUAL_PREFIXES]
+        
+        for match in self._find_manual_codes(text):
+            refs = refs_by_manual[match.lastindex - 1]
+            ref_text = match.group().upper()
+            target = ref_text.lower()
+            if target in refs:
+                continue
+            
+            manual_type = self.HMRC_MANUAL_PREFIXES[match.lastindex - 1][1]
+            
+            # Get context
+            context_start = max(0, match.start() - 50)
+            context_end = min(len(text), match.end() + 50)
+            
+            # Determine relationship type from context
+            relationship = self._infer_relationship(text_lower[context_start:context_end])
+            
+            # Try to construct URL
+            target_url = self._construct_manual_url(target, manual_type)
+            
+            refs[target] = DetectedReference(
+                reference_type='hmrc_manual',
+                reference_text=ref_text,
+                target_normalized=target,
+                target_url=target_url,
+                context=text[context_start:context_end],
+                position=match.start(),
+                relationship_type=relationship,
+                strength='explicit',
+            )
+        
+        return [ref for refs in refs_by_manual for ref in refs.values()]
+    
+    def _find_manual_codes(self, text: str) -> Iterator[re.Match]:
+        """Yield a HMRC_MANUAL_PATTERN match for each manual code in text."""
+        for number in self.MANUAL_NUMBER_PATTERN.finditer(text):
+            # Step back over the letters in front of the number and let the
+            # manual pattern check them against the known prefixes
+            start = number.start()
+            limit = max(0, start - self.MANUAL_PREFIX_MAX_LEN)
+            while start > limit and text[start - 1].isalpha():
+                start -= 1
+            
+            match = self.HMRC_MANUAL_PATTERN.match(text, start)
+            if match is not None:
+                yield match
     
     def _detect_section_references(self, text: str) -> List[DetectedReference]:
-        """Detect section/paragraph references."""
-        refs = []
+        """Detect section/paragraph references, first of each per pattern."""
+        # Grouped by pattern, so deduplication keeps the same occurrence as
+        # when each pattern was scanned separately
+        refs_by_pattern = [{} for _ in self.SECTION_PATTERNS]
         
-        for pattern, ref_type in self.SECTION_PATTERNS:
-            for match in pattern.finditer(text):
-                section_num = match.group(1)
-                
-                context_start = max(0, match.start() - 30)
-                context_end = min(len(text), match.end() + 30)
-                
-                refs.append(DetectedReference(
-                    reference_type='section',
-                    reference_text=f"section {section_num}",
-                    target_normalized=f"section_{section_num}",
-                    context=text[context_start:context_end],
-                    position=match.start(),
-                    relationship_type='references',
-                    strength='explicit',
-                ))
+        for match in self.SECTION_PATTERN.finditer(text):
+            refs = refs_by_pattern[match.lastindex - 1]
+            section_num = match.group(match.lastindex)
+            if section_num in refs:
+                continue
+            
+            context_start = max(0, match.start() - 30)
+            context_end = min(len(text), match.end() + 30)
+            
+            refs[section_num] = DetectedReference(
+                reference_type='section',
+                reference_text=f"section {section_num}",
+                target_normalized=f"section_{section_num}",
+                context=text[context_start:context_end],
+                position=match.start(),
+                relationship_type='references',
+                strength='explicit',
+            )
         
-        return refs
+        return [ref for refs in refs_by_pattern for ref in refs.values()]
     
     def _detect_legislation_references(self, text: str) -> List[DetectedReference]:
-        """Detect legislation references."""
-        refs = []
+        """Detect legislation references, first occurrence of each only."""
+        refs = {}
         
         for pattern, ref_type in self.LEGISLATION_PATTERNS:
             for match in pattern.finditer(text):
@@ -242,11 +365,13 @@ class ReferenceDetector(BaseExtractor):
                 else:
                     ref_text = match.group(1)
                     normalized = ref_text.lower().replace(' ', '_')
+                if normalized in refs:
+                    continue
                 
                 context_start = max(0, match.start() - 30)
                 context_end = min(len(text), match.end() + 30)
                 
-                refs.append(DetectedReference(
+                refs[normalized] = DetectedReference(
                     reference_type='legislation',
                     reference_text=ref_text,
                     target_normalized=normalized,
@@ -254,56 +379,56 @@ class ReferenceDetector(BaseExtractor):
                     position=match.start(),
                     relationship_type='cites',
                     strength='explicit',
-                ))
+                )
         
-        return refs
+        return list(refs.values())
     
     def _detect_definition_references(self, text: str) -> List[DetectedReference]:
-        """Detect references to defined terms."""
-        refs = []
+        """Detect references to defined terms, first occurrence of each only."""
+        refs = {}
         
         for pattern, ref_type in self.DEFINITION_PATTERNS:
             for match in pattern.finditer(text):
                 term = match.group(1)
+                normalized = term.lower().replace(' ', '_')
+                if normalized in refs:
+                    continue
                 
                 context_start = max(0, match.start() - 30)
                 context_end = min(len(text), match.end() + 50)
                 
-                refs.append(DetectedReference(
+                refs[normalized] = DetectedReference(
                     reference_type='definition',
                     reference_text=term,
-                    target_normalized=term.lower().replace(' ', '_'),
+                    target_normalized=normalized,
                     context=text[context_start:context_end],
                     position=match.start(),
                     relationship_type='defines',
                     strength='explicit',
-                ))
+                )
         
-        return refs
+        return list(refs.values())
     
     def _detect_govuk_links(self, html: str, text: str) -> List[DetectedReference]:
         """Detect GOV.UK internal links from HTML."""
         refs = []
         
         # Parse HTML for actual links
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser', parse_only=self.LINK_STRAINER)
         
         for link in soup.find_all('a', href=True):
             href = link['href']
             
             # Check if internal GOV.UK link
-            if href.startswith('/') or 'gov.uk' in href:
+            is_relative = href.startswith('/')
+            if is_relative or 'gov.uk' in href:
                 # Normalize URL
-                if href.startswith('/'):
-                    full_url = f"https://www.gov.uk{href}"
-                else:
-                    full_url = href
+                full_url = f"https://www.gov.uk{href}" if is_relative else href
                 
                 # Skip anchors and non-content links
-                if '#' in href and href.index('#') == 0:
+                if href.startswith('#'):
                     continue
-                if any(skip in href for skip in ['/sign-in', '/register', '/search']):
+                if '/sign-in' in href or '/register' in href or '/search' in href:
                     continue
                 
                 link_text = self.clean_text(link.get_text())
@@ -320,57 +445,53 @@ class ReferenceDetector(BaseExtractor):
         
         return refs
     
-    def _infer_relationship(self, context: str) -> str:
-        """Infer the relationship type from context."""
-        context_lower = context.lower()
-        
-        if any(w in context_lower for w in ['see', 'refer to', 'explained in']):
+    def _infer_relationship(self, context_lower: str) -> str:
+        """Infer the relationship type from lowercased context."""
+        # Checked in priority order: a context that says "see" is a plain
+        # reference whatever else it mentions
+        if 'see' in context_lower or 'refer to' in context_lower or 'explained in' in context_lower:
             return 'references'
-        elif any(w in context_lower for w in ['supersedes', 'replaces', 'replaced by']):
+        elif 'supersedes' in context_lower or 'replaces' in context_lower or 'replaced by' in context_lower:
             return 'supersedes'
-        elif any(w in context_lower for w in ['defines', 'definition']):
+        elif 'defines' in context_lower or 'definition' in context_lower:
             return 'defines'
-        elif any(w in context_lower for w in ['example', 'such as']):
+        elif 'example' in context_lower or 'such as' in context_lower:
             return 'example_of'
         
         return 'references'
     
-    def _construct_manual_url(self, ref: str, manual_type: str) -> Optional[str]:
-        """Try to construct the URL for an HMRC manual reference."""
-        base = self.MANUAL_URL_BASES.get(manual_type)
-        if not base:
+    def _construct_manual_url(self, ref_lower: str, manual_type: str) -> Optional[str]:
+        """Try to construct the URL for a lowercased HMRC manual reference."""
+        if manual_type not in self.MANUAL_URL_BASES:
             return None
         
-        # Extract manual section prefix and number
-        # e.g., VATREG02200 -> vatreg02200
-        return f"https://www.gov.uk/hmrc-internal-manuals/{ref.lower()}"
+        # e.g., vatreg02200 -> https://www.gov.uk/hmrc-internal-manuals/vatreg02200
+        return self.MANUAL_URL_ROOT + ref_lower
     
     def _deduplicate_references(self, refs: List[DetectedReference]) -> List[DetectedReference]:
-        """Remove duplicate references."""
-        seen = set()
-        unique = []
+        """Remove duplicate references, keeping the first of each."""
+        unique = {}
         
         for ref in refs:
-            key = (ref.reference_type, ref.target_normalized)
-            if key not in seen:
-                seen.add(key)
-                unique.append(ref)
+            unique.setdefault((ref.reference_type, ref.target_normalized), ref)
         
-        return unique
+        return list(unique.values())
     
     def has_references(self, text: str) -> bool:
         """Quick check if text contains cross-references."""
         # Check for any HMRC manual reference
-        for pattern, _ in self.HMRC_MANUAL_PATTERNS:
-            if pattern.search(text):
-                return True
+        if next(self._find_manual_codes(text), None) is not None:
+            return True
+        
+        text_lower = self.lowercase_text(text)
         
         # Check for section references
-        if re.search(r'(?:see|refer\s+to)\s+(?:section|paragraph)', text, re.I):
+        if (('section' in text_lower or 'paragraph' in text_lower)
+                and self.SECTION_HINT_PATTERN.search(text_lower)):
             return True
         
         # Check for legislation
-        if re.search(r'(?:Finance|Tax)\s+Act\s+\d{4}', text, re.I):
+        if 'act' in text_lower and self.LEGISLATION_HINT_PATTERN.search(text_lower):
             return True
         
         return False
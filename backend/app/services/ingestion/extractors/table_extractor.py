@@ -19,8 +19,10 @@ Example Tables Found in UK Tax Documents:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import islice
 from typing import List, Dict, Any, Optional, Tuple
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 import re
 import logging
 
@@ -152,6 +154,15 @@ class TableExtractor(BaseExtractor):
         ],
     }
     
+    # One alternation per type, compiled once. Types are still tried in
+    # order: a single alternation across all types would report whichever
+    # keyword comes first in the text, not the highest-priority type.
+    # Matched case-sensitively against lowercased text.
+    TABLE_TYPE_PATTERNS = {
+        table_type: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+        for table_type, patterns in TABLE_TYPE_KEYWORDS.items()
+    }
+    
     # Header keywords for identifying lookup/value columns
     LOOKUP_KEYWORDS = [
         r'\bfrom\b', r'\bover\b', r'\babove\b', r'\bband\b',
@@ -163,6 +174,31 @@ class TableExtractor(BaseExtractor):
         r'\btax\b', r'\bpayable', r'\bdue\b'
     ]
     
+    # Kept as two patterns: a header can be both a lookup and a value column
+    LOOKUP_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in LOOKUP_KEYWORDS))
+    VALUE_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in VALUE_KEYWORDS))
+    
+    # Opening <table tag in any case, found without lowercasing the page
+    TABLE_TAG_PATTERN = re.compile(r'<table', re.I)
+    
+    # Only <table> elements and their contents are built, rather than the
+    # whole document tree
+    TABLE_STRAINER = SoupStrainer('table')
+    
+    # A cell that is a plain number once commas and spaces are dropped,
+    # e.g. "1,000", "1 000" or "- 12.5"
+    PLAIN_NUMBER_PATTERN = re.compile(r'[,\s]*(?:-[,\s]*)?\d[\d,\s]*(?:\.[,\s]*\d[\d,\s]*)?')
+    NUMBER_SEPARATOR_PATTERN = re.compile(r'[,\s]')
+    
+    # A first-row cell made only of figures, which is data rather than a header
+    NUMERIC_CELL_PATTERN = re.compile(r'^[\d,.%£]+$')
+    
+    # Parsed values kept by _parse_cell_text, keyed by cleaned cell text
+    CELL_CACHE_SIZE = 4096
+    
+    # Below this many documents, worker start-up costs more than it saves
+    PARALLEL_MIN_DOCUMENTS = 16
+    
     def __init__(self):
         super().__init__()
     
@@ -187,14 +223,15 @@ class TableExtractor(BaseExtractor):
         """
         result = ExtractionResult[ExtractedTable](source_url=source_url)
         
-        if not html_content:
+        # Skip building a parser for pages with no tables at all
+        if not self.has_tables(html_content):
             return result
         
         # Get tax year from context if not provided
         tax_year = kwargs.get('tax_year') or self.extract_tax_year(text_content)
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'html.parser', parse_only=self.TABLE_STRAINER)
             tables = soup.find_all('table')
             
             for idx, table_elem in enumerate(tables):
@@ -212,6 +249,31 @@ class TableExtractor(BaseExtractor):
         
         return result
     
+    def extract_batch(
+        self,
+        documents: List[Tuple[Optional[str], str, str]],
+        workers: Optional[int] = None,
+        **kwargs
+    ) -> List[ExtractionResult[ExtractedTable]]:
+        """
+        Run extract over many documents, in worker processes for large
+        batches (see map_in_processes).
+        
+        Args:
+            documents: (html_content, text_content, source_url) per document
+            workers: Number of worker processes (default: CPU count)
+            **kwargs: Passed to extract for every document
+        
+        Returns:
+            One ExtractionResult per document, in input order
+        """
+        html_contents, text_contents, source_urls = zip(*documents) if documents else ((), (), ())
+        return self.map_in_processes(
+            partial(self.extract, **kwargs), html_contents, text_contents, source_urls,
+            workers=workers,
+            min_items=self.PARALLEL_MIN_DOCUMENTS
+        )
+    
     def _extract_table(
         self, 
         table_elem: Tag, 
@@ -242,8 +304,7 @@ class TableExtractor(BaseExtractor):
         column_types = self._infer_column_types(headers, rows)
         
         # Identify lookup and value columns
-        lookup_keys = self._identify_lookup_columns(headers)
-        value_columns = self._identify_value_columns(headers)
+        lookup_keys, value_columns = self._identify_key_columns(headers)
         
         # Generate table name
         table_name = self._generate_table_name(table_type, headers, tax_year)
@@ -282,7 +343,7 @@ class TableExtractor(BaseExtractor):
             header_row = thead.find('tr')
             if header_row:
                 headers = [
-                    self.clean_text(th.get_text())
+                    self._cell_text(th)
                     for th in header_row.find_all(['th', 'td'])
                 ]
         
@@ -292,7 +353,7 @@ class TableExtractor(BaseExtractor):
             if first_row:
                 th_cells = first_row.find_all('th')
                 if th_cells:
-                    headers = [self.clean_text(th.get_text()) for th in th_cells]
+                    headers = [self._cell_text(th) for th in th_cells]
         
         # Last resort: treat first row as headers
         if not headers:
@@ -300,8 +361,8 @@ class TableExtractor(BaseExtractor):
             if first_row:
                 cells = first_row.find_all(['td', 'th'])
                 # Only use if cells have text and aren't just numbers
-                cell_texts = [self.clean_text(c.get_text()) for c in cells]
-                if cell_texts and not all(re.match(r'^[\d,.%£]+$', t) for t in cell_texts if t):
+                cell_texts = [self._cell_text(c) for c in cells]
+                if cell_texts and not all(self.NUMERIC_CELL_PATTERN.match(t) for t in cell_texts if t):
                     headers = cell_texts
         
         # Normalize headers (remove empty, ensure unique)
@@ -310,17 +371,34 @@ class TableExtractor(BaseExtractor):
         
         return headers
     
+    def _cell_text(self, cell: Tag) -> str:
+        """Cleaned text of a table cell."""
+        # Most cells hold a single string, which needs no subtree walk.
+        # Only direct children are checked: Tag.string recurses through
+        # single-child tags and can overflow on deeply nested markup.
+        # Comments and script strings are left to get_text(), which skips them.
+        contents = cell.contents
+        if len(contents) == 1 and type(contents[0]) is NavigableString:
+            return self.clean_text(contents[0])
+        return self.clean_text(cell.get_text())
+    
     def _make_headers_unique(self, headers: List[str]) -> List[str]:
-        """Ensure all header names are unique."""
-        seen = {}
+        """
+        Ensure all header names are unique.
+        
+        Repeats get the next free numeric suffix ("Rate", "Rate_1", ...),
+        also skipping names that appear literally in the headers.
+        """
+        seen = set()
         unique = []
         for h in headers:
-            if h in seen:
-                seen[h] += 1
-                unique.append(f"{h}_{seen[h]}")
-            else:
-                seen[h] = 0
-                unique.append(h)
+            name = h
+            suffix = 0
+            while name in seen:
+                suffix += 1
+                name = f"{h}_{suffix}"
+            seen.add(name)
+            unique.append(name)
         return unique
     
     def _extract_rows(self, table_elem: Tag, headers: List[str]) -> List[Dict[str, Any]]:
@@ -380,14 +458,21 @@ class TableExtractor(BaseExtractor):
         - 20% → 20.0 (float, stored as percentage)
         - 1,000 → 1000 (int)
         - Other → string
-        """
-        text = self.clean_text(cell.get_text())
         
+        Results are cached by cell text; tax tables repeat values such as
+        "0%", "£0" and "N/A" across rows and documents.
+        """
+        return self._parse_cell_text(self._cell_text(cell))
+    
+    @staticmethod
+    @lru_cache(maxsize=CELL_CACHE_SIZE)
+    def _parse_cell_text(text: str) -> Any:
+        """Parse cleaned cell text; see _parse_cell_value."""
         if not text or text == '-' or text.lower() == 'n/a':
             return None
         
         # Try currency
-        currency_match = self.GBP_PATTERN.search(text)
+        currency_match = '£' in text and TableExtractor.GBP_PATTERN.search(text)
         if currency_match:
             amount_str = currency_match.group(1).replace(',', '')
             try:
@@ -396,7 +481,7 @@ class TableExtractor(BaseExtractor):
                 pass
         
         # Try percentage
-        pct_match = self.PERCENTAGE_PATTERN.search(text)
+        pct_match = '%' in text and TableExtractor.PERCENTAGE_PATTERN.search(text)
         if pct_match:
             try:
                 return float(pct_match.group(1))
@@ -404,8 +489,8 @@ class TableExtractor(BaseExtractor):
                 pass
         
         # Try plain number
-        plain_num = re.sub(r'[,\s]', '', text)
-        if re.match(r'^-?\d+(?:\.\d+)?$', plain_num):
+        if TableExtractor.PLAIN_NUMBER_PATTERN.fullmatch(text):
+            plain_num = TableExtractor.NUMBER_SEPARATOR_PATTERN.sub('', text)
             try:
                 if '.' in plain_num:
                     return float(plain_num)
@@ -422,20 +507,27 @@ class TableExtractor(BaseExtractor):
     ) -> str:
         """
         Classify the table type based on headers and content.
+        
+        Headers are short and usually settle the type on their own: when
+        they match the first type, nothing can outrank it and the row
+        sample is never built.
         """
-        header_lower = header_text.lower()
+        header_lower = self.lowercase_text(header_text)
+        
+        first_type, first_pattern = next(iter(self.TABLE_TYPE_PATTERNS.items()))
+        if first_pattern.search(header_lower):
+            return first_type
         
         # Also check first few row values for context
         sample_values = []
         for row in rows[:3]:
-            sample_values.extend(str(v).lower() for v in row.values() if v)
+            sample_values.extend(str(v) for v in row.values() if v)
         sample_text = ' '.join(sample_values)
-        combined_text = header_lower + ' ' + sample_text
+        combined_text = header_lower + ' ' + self.lowercase_text(sample_text)
         
-        for table_type, patterns in self.TABLE_TYPE_KEYWORDS.items():
-            for pattern in patterns:
-                if re.search(pattern, combined_text, re.IGNORECASE):
-                    return table_type
+        for table_type, pattern in self.TABLE_TYPE_PATTERNS.items():
+            if pattern.search(combined_text):
+                return table_type
         
         return "other"
     
@@ -450,36 +542,35 @@ class TableExtractor(BaseExtractor):
         column_types = {}
         
         for header in headers:
-            values = [str(row.get(header, '')) for row in rows if row.get(header) is not None]
-            column_types[header] = self.infer_column_type(values)
+            # Only the sampled values are converted; infer_column_type
+            # ignores the rest of the column
+            values = islice(
+                (str(value) for value in (row.get(header) for row in rows) if value is not None),
+                self.COLUMN_TYPE_SAMPLE_SIZE
+            )
+            column_types[header] = self.infer_column_type(list(values))
         
         return column_types
     
-    def _identify_lookup_columns(self, headers: List[str]) -> List[str]:
-        """Identify which columns are suitable for lookups."""
-        lookup_cols = []
-        
-        for header in headers:
-            header_lower = header.lower()
-            for pattern in self.LOOKUP_KEYWORDS:
-                if re.search(pattern, header_lower):
-                    lookup_cols.append(header)
-                    break
+    def _identify_key_columns(self, headers: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Identify which columns are suitable for lookups and which contain
+        the answer values, in one pass over the headers.
         
-        return lookup_cols
-    
-    def _identify_value_columns(self, headers: List[str]) -> List[str]:
-        """Identify which columns contain the answer values."""
+        Returns:
+            (lookup columns, value columns); a column may be in both
+        """
+        lookup_cols = []
         value_cols = []
         
         for header in headers:
             header_lower = header.lower()
-            for pattern in self.VALUE_KEYWORDS:
-                if re.search(pattern, header_lower):
-                    value_cols.append(header)
-                    break
+            if self.LOOKUP_PATTERN.search(header_lower):
+                lookup_cols.append(header)
+            if self.VALUE_PATTERN.search(header_lower):
+                value_cols.append(header)
         
-        return value_cols
+        return lookup_cols, value_cols
     
     def _generate_table_name(
         self, 
@@ -528,6 +619,9 @@ class TableExtractor(BaseExtractor):
         """
         lines = [f"{table_name}:"]
         
+        # Columns whose float values are percentages, decided once per header
+        rate_headers = {header for header in headers if 'rate' in header.lower() or '%' in header}
+        
         for row in rows:
             # Try to create a natural language description
             parts = []
@@ -536,7 +630,7 @@ class TableExtractor(BaseExtractor):
                     # Format value appropriately
                     if isinstance(value, float):
                         # Check if it's a percentage or currency
-                        if 'rate' in header.lower() or '%' in header:
+                        if header in rate_headers:
                             parts.append(f"{header}: {value}%")
                         elif value >= 1000:
                             parts.append(f"{header}: £{value:,.0f}")
@@ -550,8 +644,13 @@ class TableExtractor(BaseExtractor):
         
         return '\n'.join(lines)
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached cell values."""
+        cls._parse_cell_text.cache_clear()
+    
     def has_tables(self, html_content: str) -> bool:
         """Quick check if HTML contains tables."""
         if not html_content:
             return False
-        return '<table' in html_content.lower()
+        return self.TABLE_TAG_PATTERN.search(html_content) is not None
@@ -14,16 +14,115 @@ Key Concepts:
 """
 
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Tuple
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
 from urllib.parse import urljoin, urlparse
+import html
+import random
+import re
+import threading
 import time
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Curated seed list of essential UK SME tax guidance, organized by topic.
+# Already normalized paths, so nothing is rebuilt per call.
+TAX_GUIDANCE_PATHS: Tuple[str, ...] = (
+    # === VAT ===
+    "/vat-registration",
+    "/vat-rates",
+    "/vat-businesses",
+    "/vat-returns",
+    "/vat-record-keeping",
+    "/vat-flat-rate-scheme",
+    "/vat-cash-accounting-scheme",
+    "/vat-annual-accounting-scheme",
+    "/charge-reclaim-record-vat",
+    "/pay-vat",
+    "/vat-corrections",
+    "/vat-registration-thresholds",
+    
+    # === Corporation Tax ===
+    "/corporation-tax",
+    "/corporation-tax-rates",
+    "/prepare-file-annual-accounts-for-limited-company",
+    "/company-tax-returns",
+    "/pay-corporation-tax",
+    "/corporation-tax-accounting-periods-and-due-dates",
+    "/hmrc-internal-manuals/company-taxation-manual",
+    
+    # === Self Assessment / Income Tax ===
+    "/self-assessment-tax-returns",
+    "/register-for-self-assessment",
+    "/understand-self-assessment-bill",
+    "/pay-self-assessment-tax-bill",
+    "/self-assessment-tax-return-forms",
+    "/income-tax-rates",
+    "/personal-allowances",
+    "/tax-on-dividends",
+    
+    # === PAYE / Employers ===
+    "/paye-for-employers",
+    "/register-employer",
+    "/running-payroll",
+    "/payroll-annual-reporting",
+    "/pay-paye-tax",
+    "/employee-tax-codes",
+    "/national-minimum-wage-rates",
+    
+    # === National Insurance ===
+    "/national-insurance",
+    "/national-insurance-rates-letters",
+    "/self-employed-national-insurance-rates",
+    "/national-insurance-classes",
+    
+    # === Making Tax Digital ===
+    "/making-tax-digital-software",
+    "/check-if-youre-eligible-for-making-tax-digital-for-income-tax",
+    
+    # === HMRC Services (Guidance Navigation) ===
+    "/contact-hmrc",
+    "/government/organisations/hm-revenue-customs/contact",
+    "/sign-in-hmrc-online-services",
+    "/personal-tax-account",
+    "/tax-appeals",
+    "/complain-about-hmrc",
+    "/get-help-hmrc-extra-support",
+    "/dealing-hmrc-additional-needs",
+    
+    # === Business Records & Compliance ===
+    "/keeping-your-pay-tax-records",
+    "/self-employed-records",
+    "/running-a-limited-company",
+    "/set-up-sole-trader",
+    "/set-up-limited-company",
+    "/set-up-business-partnership",
+    
+    # === R&D Tax Credits ===
+    "/guidance/corporation-tax-research-and-development-rd-relief",
+    "/hmrc-internal-manuals/corporate-intangibles-research-and-development-manual",
+)
+
+# Key HMRC technical manuals for SME tax compliance
+HMRC_MANUAL_PATHS: Tuple[str, ...] = (
+    "/hmrc-internal-manuals/vat-guide",  # Core VAT guidance
+    "/hmrc-internal-manuals/vat-registration",  # VAT registration details
+    "/hmrc-internal-manuals/company-taxation-manual",  # Corporation Tax
+    "/hmrc-internal-manuals/business-income-manual",  # Self-employed income
+    "/hmrc-internal-manuals/employment-income-manual",  # PAYE
+    "/hmrc-internal-manuals/corporate-intangibles-research-and-development-manual",  # R&D
+    "/hmrc-internal-manuals/self-assessment-manual",  # Self Assessment
+)
+
+
 @dataclass
 class GovUKDocument:
     """
@@ -55,7 +154,8 @@ class GovUKDocument:
     # For HMRC manuals - child sections to crawl
     child_sections: List[Dict[str, str]]  # [{title: "...", path: "..."}, ...]
     
-    # Raw API response (for debugging/audit)
+    # Raw API response (for debugging/audit); empty when the caller
+    # asked not to keep it
     raw_response: Dict[str, Any]
 
 
@@ -82,31 +182,89 @@ class GovUKClient:
     BASE_URL = "https://www.gov.uk"
     API_BASE = "https://www.gov.uk/api/content"
     
+    # Prefixes _normalize_path treats as full URLs rather than paths
+    URL_SCHEMES = ("http://", "https://")
+    
     # Rate limiting: GOV.UK asks for reasonable usage
     # We'll be polite and wait between requests
     REQUEST_DELAY_SECONDS = 0.5
     
-    def __init__(self, timeout: int = 30):
+    # Requests kept in flight at once, e.g. manual sections during
+    # fetch_hmrc_manual. Fetching is pure network wait, so threads overlap
+    # the round trips while _rate_limit still spaces out request starts.
+    MAX_WORKERS = 4
+    
+    # Each client caches the parsed fields of the documents it fetched,
+    # keyed by path, with the response's validators. Fresh entries
+    # (within Cache-Control max-age) are served without a request; stale
+    # ones are revalidated with If-None-Match / If-Modified-Since, so an
+    # unchanged page costs a 304 instead of a full download and parse.
+    # Bounded by entry count and by the characters of text held.
+    RESPONSE_CACHE_SIZE = 1024
+    RESPONSE_CACHE_MAX_CHARS = 32 * 1024 * 1024
+    
+    MAX_AGE_PATTERN = re.compile(r'max-age=(\d+)')
+    
+    # Transient failures (rate limiting, CDN/server errors, dropped
+    # connections) are retried with exponential backoff before a fetch
+    # gives up, so one blip doesn't lose a page mid-crawl
+    MAX_RETRIES = 3
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    RETRY_BACKOFF_SECONDS = 1.0
+    MAX_RETRY_DELAY_SECONDS = 30.0
+    
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_workers: int = MAX_WORKERS,
+        request_delay: float = REQUEST_DELAY_SECONDS
+    ):
         """
         Initialize the GOV.UK client.
         
         Args:
             timeout: Request timeout in seconds
+            max_workers: Most requests in flight at once, across all
+                threads using this client (1 fetches serially)
+            request_delay: Minimum seconds between request starts
+                (0 disables pacing)
         """
         self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+        self.request_delay = request_delay
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "UKSMETaxComplianceBot/1.0 (Educational/Research)",
             "Accept": "application/json"
         })
-        self._last_request_time = 0
+        # One pooled keep-alive connection per concurrent fetch; the
+        # default pool of 10 would drop and reopen sockets beyond that
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_maxsize=max(self.max_workers, 10))
+        )
+        self._fetch_slots = threading.BoundedSemaphore(self.max_workers)
+        self._next_request_time = 0.0
+        self._rate_lock = threading.Lock()
+        self._response_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._response_cache_chars = 0
+        self._response_cache_lock = threading.Lock()
     
     def _rate_limit(self):
         """Ensure we don't overwhelm GOV.UK servers"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.REQUEST_DELAY_SECONDS:
-            time.sleep(self.REQUEST_DELAY_SECONDS - elapsed)
-        self._last_request_time = time.time()
+        if self.request_delay <= 0:
+            return
+        
+        # Each caller books the next free start slot under the lock and
+        # then sleeps until it outside the lock, so waiting threads don't
+        # hold each other up and an idle client starts straight away
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + self.request_delay
+        
+        if start > now:
+            time.sleep(start - now)
     
     def _normalize_path(self, path_or_url: str) -> str:
         """
@@ -117,9 +275,12 @@ class GovUKClient:
             "/vat-registration" → "/vat-registration"
             "vat-registration" → "/vat-registration"
         """
-        if path_or_url.startswith("http"):
-            parsed = urlparse(path_or_url)
-            path = parsed.path
+        # Seed paths and crawled child paths are already in this form
+        if path_or_url.startswith("/"):
+            return path_or_url
+        
+        if path_or_url.startswith(self.URL_SCHEMES):
+            path = urlparse(path_or_url).path
         else:
             path = path_or_url
         
@@ -133,17 +294,20 @@ class GovUKClient:
         if not date_str:
             return None
         try:
-            # GOV.UK uses ISO format: "2024-03-15T09:30:00+00:00"
-            # Remove timezone for simplicity (all GOV.UK times are UK)
-            clean = date_str.replace("+00:00", "").replace("Z", "")
-            if "T" in clean:
-                return datetime.fromisoformat(clean)
-            return datetime.fromisoformat(clean + "T00:00:00")
+            # GOV.UK uses ISO format: "2024-03-15T09:30:00+00:00" (or "...Z",
+            # or a bare date, which fromisoformat reads as midnight).
+            # Remove a UTC suffix for simplicity (all GOV.UK times are UK);
+            # slicing it off is cheaper than parsing and then dropping tzinfo.
+            if date_str.endswith("+00:00"):
+                date_str = date_str[:-6]
+            elif date_str.endswith("Z"):
+                date_str = date_str[:-1]
+            return datetime.fromisoformat(date_str)
         except (ValueError, TypeError):
             logger.warning(f"Could not parse date: {date_str}")
             return None
     
-    def _extract_breadcrumbs(self, data: Dict) -> List[Dict[str, str]]:
+    def _extract_breadcrumbs(self, links: Dict) -> List[Dict[str, str]]:
         """
         Extract navigation breadcrumbs from API response.
         
@@ -152,32 +316,17 @@ class GovUKClient:
         
         This helps us understand document context and relationships.
         """
-        breadcrumbs = []
-        
-        # Try links.ordered_related_items first (newer API format)
-        links = data.get("links", {})
-        
-        # Check for parent taxons (topic hierarchy)
-        taxons = links.get("taxons", [])
-        if taxons:
-            for taxon in taxons:
-                breadcrumbs.append({
-                    "title": taxon.get("title", ""),
-                    "path": taxon.get("base_path", "")
-                })
-        
-        # Check for parent (direct parent document)
-        parents = links.get("parent", [])
-        if parents:
-            for parent in parents:
-                breadcrumbs.append({
-                    "title": parent.get("title", ""),
-                    "path": parent.get("base_path", "")
-                })
-        
-        return breadcrumbs
+        # Parent taxons (topic hierarchy), then the direct parent document
+        return [
+            {
+                "title": item.get("title", ""),
+                "path": item.get("base_path", "")
+            }
+            for key in ("taxons", "parent")
+            for item in links.get(key) or ()
+        ]
     
-    def _extract_child_sections(self, data: Dict) -> List[Dict[str, str]]:
+    def _extract_child_sections(self, links: Dict) -> List[Dict[str, str]]:
         """
         Extract child sections for HMRC manuals.
         
@@ -186,44 +335,36 @@ class GovUKClient:
         
         We need to crawl all levels to get complete coverage.
         """
-        children = []
-        links = data.get("links", {})
-        
-        # For manuals - "children" contains subsections
-        for child in links.get("children", []):
-            children.append({
-                "title": child.get("title", ""),
-                "path": child.get("base_path", ""),
-                "document_type": child.get("document_type", "")
-            })
-        
-        # For some structures - "child_taxons"
-        for child in links.get("child_taxons", []):
-            children.append({
+        # For manuals "children" contains subsections; some structures
+        # use "child_taxons" instead
+        return [
+            {
                 "title": child.get("title", ""),
                 "path": child.get("base_path", ""),
                 "document_type": child.get("document_type", "")
-            })
-        
-        return children
+            }
+            for key in ("children", "child_taxons")
+            for child in links.get(key) or ()
+        ]
     
-    def _extract_body_html(self, data: Dict) -> str:
+    def _extract_body_html(self, details: Dict, base_path: str = "unknown") -> str:
         """
         Extract the main body content from API response.
         
         GOV.UK has different content structures depending on document type:
-        - "body" field for simple pages
+        - "body" field for simple pages, with "introduction" ahead of it
+          in some manual sections
         - "parts" array for multi-part guides
-        - "details.body" for some formats
+        - "child_section_groups" for manual overview pages
         
         We handle all variations and combine into single HTML string.
         """
-        details = data.get("details", {})
-        
-        # Case 1: Simple body field
+        # Case 1: Simple body field, after the introduction when a manual
+        # section has both
+        intro = details.get("introduction", "")
         body = details.get("body", "")
         if body:
-            return body
+            return f"{intro}\n{body}" if intro else body
         
         # Case 2: Multi-part guide (like /vat-registration which has multiple tabs)
         parts = details.get("parts", [])
@@ -233,21 +374,14 @@ class GovUKClient:
                 part_title = part.get("title", "")
                 part_body = part.get("body", "")
                 if part_title:
-                    html_parts.append(f"<h2>{part_title}</h2>")
+                    html_parts.append(f"<h2>{html.escape(part_title)}</h2>")
                 if part_body:
                     html_parts.append(part_body)
             return "\n".join(html_parts)
         
-        # Case 3: Introduction + body (some manual sections)
-        intro = details.get("introduction", "")
-        main_body = details.get("body", "")
-        if intro or main_body:
-            parts = []
-            if intro:
-                parts.append(intro)
-            if main_body:
-                parts.append(main_body)
-            return "\n".join(parts)
+        # Case 3: Introduction only (some manual sections)
+        if intro:
+            return intro
         
         # Case 4: child_section_groups (for manual overview pages)
         groups = details.get("child_section_groups", [])
@@ -256,27 +390,32 @@ class GovUKClient:
             for group in groups:
                 group_title = group.get("title", "")
                 if group_title:
-                    html_parts.append(f"<h2>{group_title}</h2>")
+                    html_parts.append(f"<h2>{html.escape(group_title)}</h2>")
                 child_sections = group.get("child_sections", [])
                 if child_sections:
                     html_parts.append("<ul>")
+                    # Titles and paths are plain text in the API, so escape
+                    # them before building markup from them
                     for section in child_sections:
-                        title = section.get("title", "")
-                        path = section.get("base_path", "")
+                        title = html.escape(section.get("title") or "")
+                        path = html.escape(section.get("base_path") or "")
                         html_parts.append(f'<li><a href="{path}">{title}</a></li>')
                     html_parts.append("</ul>")
             return "\n".join(html_parts)
         
         # Fallback: return empty (will be caught by parser)
-        logger.warning(f"No body content found for: {data.get('base_path', 'unknown')}")
+        logger.warning(f"No body content found for: {base_path}")
         return ""
     
-    def fetch_document(self, path_or_url: str) -> GovUKDocument:
+    def fetch_document(self, path_or_url: str, store_raw: bool = True) -> GovUKDocument:
         """
         Fetch a single document from GOV.UK API.
         
         Args:
             path_or_url: Either full URL or path like "/vat-registration"
+            store_raw: Keep the decoded API response on raw_response.
+                The response cache only holds parsed fields, so this
+                always downloads the page.
         
         Returns:
             GovUKDocument with all extracted metadata and content
@@ -290,13 +429,83 @@ class GovUKClient:
             # doc.body_html = "<p>You must register...</p>"
         """
         path = self._normalize_path(path_or_url)
+        fields, data = self._get_fields(path, store_raw)
+        
+        return self._build_document(fields, data if store_raw else {})
+    
+    def _parse_fields(self, data: Dict, path: str) -> Dict[str, Any]:
+        """
+        Extract the GovUKDocument fields from a decoded API response.
+        
+        details and links are looked up once here and handed to the
+        extract helpers, rather than each helper digging them out again.
+        """
+        details = data.get("details") or {}
+        links = data.get("links") or {}
+        parents = links.get("parent")
+        parent = parents[0] if parents else {}
+        
+        return {
+            "url": f"{self.BASE_URL}{path}",
+            "base_path": path,
+            "title": data.get("title", "Untitled"),
+            "description": data.get("description"),
+            "body_html": self._extract_body_html(details, data.get("base_path", "unknown")),
+            "document_type": data.get("document_type", "unknown"),
+            "schema_name": data.get("schema_name", "unknown"),
+            "first_published": self._parse_datetime(data.get("first_published_at")),
+            "last_updated": self._parse_datetime(data.get("public_updated_at")),
+            "breadcrumbs": self._extract_breadcrumbs(links),
+            "parent_title": parent.get("title"),
+            "parent_path": parent.get("base_path"),
+            "child_sections": self._extract_child_sections(links),
+        }
+    
+    def _build_document(self, fields: Dict[str, Any], raw_response: Dict[str, Any]) -> GovUKDocument:
+        """
+        Build a new GovUKDocument from (possibly cached) parsed fields.
+        
+        The breadcrumb and child section lists are copied, so a caller
+        editing its document can't change the cache or other documents.
+        """
+        document = GovUKDocument(**fields, raw_response=raw_response)
+        document.breadcrumbs = [dict(crumb) for crumb in document.breadcrumbs]
+        document.child_sections = [dict(child) for child in document.child_sections]
+        return document
+    
+    def _get_fields(self, path: str, store_raw: bool = False) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Return the parsed document fields for a path, via the response cache.
+        
+        Also returns the decoded API response when the page was downloaded
+        (None when the fields came from the cache). With store_raw the
+        cache is skipped on the way in, since it has no response to give.
+        
+        Raises:
+            GovUKContentAPIError: If API returns error or document not found
+        """
+        cached = None if store_raw else self._cache_get(path)
+        if cached is not None and cached["expires"] > time.monotonic():
+            logger.debug(f"Cache hit: {path}")
+            return cached["fields"], None
+        
         api_url = f"{self.API_BASE}{path}"
+        headers = {}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
         
         logger.info(f"Fetching: {api_url}")
-        self._rate_limit()
         
         try:
-            response = self.session.get(api_url, timeout=self.timeout)
+            response = self._request(api_url, headers)
+            
+            if response.status_code == 304 and cached is not None:
+                logger.debug(f"Not modified: {path}")
+                self._cache_put(path, response, cached["fields"], cached)
+                return cached["fields"], None
             
             if response.status_code == 404:
                 raise GovUKContentAPIError(f"Document not found: {path}")
@@ -311,28 +520,150 @@ class GovUKClient:
         except requests.RequestException as e:
             raise GovUKContentAPIError(f"Request failed: {e}")
         
-        # Extract all fields
-        links = data.get("links", {})
-        parent = links.get("parent", [{}])[0] if links.get("parent") else {}
-        
-        return GovUKDocument(
-            url=f"{self.BASE_URL}{path}",
-            base_path=path,
-            title=data.get("title", "Untitled"),
-            description=data.get("description"),
-            body_html=self._extract_body_html(data),
-            document_type=data.get("document_type", "unknown"),
-            schema_name=data.get("schema_name", "unknown"),
-            first_published=self._parse_datetime(data.get("first_published_at")),
-            last_updated=self._parse_datetime(data.get("public_updated_at")),
-            breadcrumbs=self._extract_breadcrumbs(data),
-            parent_title=parent.get("title"),
-            parent_path=parent.get("base_path"),
-            child_sections=self._extract_child_sections(data),
-            raw_response=data
-        )
+        fields = self._parse_fields(data, path)
+        self._cache_put(path, response, fields)
+        return fields, data
     
-    def fetch_hmrc_manual(self, manual_path: str, max_sections: Optional[int] = None) -> List[GovUKDocument]:
+    def _request(self, api_url: str, headers: Dict[str, str]) -> requests.Response:
+        """
+        GET an API URL, retrying transient failures.
+        
+        Returns the first response that isn't worth retrying, or the last
+        one once MAX_RETRIES is used up; dropped connections and timeouts
+        are re-raised after the last attempt.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                with self._fetch_slots:
+                    self._rate_limit()
+                    response = self.session.get(
+                        api_url, headers=headers, timeout=self.timeout
+                    )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.MAX_RETRIES:
+                    raise
+                delay = self._retry_delay(attempt)
+            else:
+                if (response.status_code not in self.RETRY_STATUS_CODES
+                        or attempt == self.MAX_RETRIES):
+                    return response
+                delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+            
+            logger.warning(
+                f"Retrying {api_url} in {delay:.1f}s "
+                f"(attempt {attempt + 1} of {self.MAX_RETRIES})"
+            )
+            # Sleep without holding a fetch slot
+            time.sleep(delay)
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retry number attempt + 1.
+        
+        Honors a Retry-After header (delay in seconds or an HTTP date),
+        otherwise backs off exponentially with jitter so parallel fetches
+        don't all retry at the same moment. Capped at MAX_RETRY_DELAY_SECONDS.
+        """
+        delay = None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    if retry_at.tzinfo is None:
+                        retry_at = retry_at.replace(tzinfo=timezone.utc)
+                    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+        
+        if delay is None:
+            delay = self.RETRY_BACKOFF_SECONDS * 2 ** attempt * (1 + random.random())
+        
+        return min(max(delay, 0.0), self.MAX_RETRY_DELAY_SECONDS)
+    
+    def _cache_get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached document, marking it recently used."""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(path)
+            if entry is not None:
+                self._response_cache.move_to_end(path)
+            return entry
+    
+    def _cache_put(
+        self,
+        path: str,
+        response,
+        fields: Dict[str, Any],
+        previous: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Cache parsed fields if the response headers allow reusing or
+        revalidating them.
+        
+        previous is the entry a 304 revalidated; its validators are kept
+        when the 304 omits them.
+        """
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return
+        
+        max_age = 0
+        if "no-cache" not in cache_control:
+            match = self.MAX_AGE_PATTERN.search(cache_control)
+            if match:
+                max_age = int(match.group(1))
+        
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if previous is not None:
+            etag = etag or previous["etag"]
+            last_modified = last_modified or previous["last_modified"]
+        if not (max_age or etag or last_modified):
+            return
+        
+        entry = {
+            "fields": fields,
+            "etag": etag,
+            "last_modified": last_modified,
+            "expires": time.monotonic() + max_age,
+            "chars": self._fields_chars(fields),
+        }
+        if entry["chars"] > self.RESPONSE_CACHE_MAX_CHARS:
+            return
+        
+        with self._response_cache_lock:
+            cache = self._response_cache
+            replaced = cache.pop(path, None)
+            if replaced is not None:
+                self._response_cache_chars -= replaced["chars"]
+            cache[path] = entry
+            self._response_cache_chars += entry["chars"]
+            while (len(cache) > self.RESPONSE_CACHE_SIZE
+                    or self._response_cache_chars > self.RESPONSE_CACHE_MAX_CHARS):
+                _, evicted = cache.popitem(last=False)
+                self._response_cache_chars -= evicted["chars"]
+    
+    @staticmethod
+    def _fields_chars(fields: Dict[str, Any]) -> int:
+        """Characters of text held by a set of document fields."""
+        values = list(fields.values())
+        for key in ("breadcrumbs", "child_sections"):
+            values.extend(value for item in fields[key] for value in item.values())
+        return sum(len(value) for value in values if isinstance(value, str))
+    
+    def clear_cache(self) -> None:
+        """Drop all cached documents."""
+        with self._response_cache_lock:
+            self._response_cache.clear()
+            self._response_cache_chars = 0
+    
+    def fetch_hmrc_manual(
+        self,
+        manual_path: str,
+        max_sections: Optional[int] = None,
+        store_raw: bool = False
+    ) -> List[GovUKDocument]:
         """
         Fetch an entire HMRC manual with all its sections.
         
@@ -341,47 +672,101 @@ class GovUKClient:
         └── /hmrc-internal-manuals/vat-guide/vat1-1 (section)
             └── /hmrc-internal-manuals/vat-guide/vat1-1-1 (subsection)
         
-        This method crawls the entire structure.
+        This method crawls the entire structure. Use iter_hmrc_manual to
+        process sections as they arrive instead of holding them all.
         
         Args:
             manual_path: Path to manual like "/hmrc-internal-manuals/vat-guide"
             max_sections: Limit number of sections (for testing)
+            store_raw: Keep each section's API response on raw_response.
+                Off by default, a manual can run to thousands of sections.
         
         Returns:
             List of all documents in the manual
         """
-        documents = []
-        visited = set()
-        to_visit = [manual_path]
+        return list(self.iter_hmrc_manual(manual_path, max_sections, store_raw))
+    
+    def iter_hmrc_manual(
+        self,
+        manual_path: str,
+        max_sections: Optional[int] = None,
+        store_raw: bool = False
+    ) -> Iterator[GovUKDocument]:
+        """
+        Crawl an HMRC manual, yielding each section as it is fetched.
         
-        while to_visit:
-            if max_sections and len(documents) >= max_sections:
-                logger.info(f"Reached max_sections limit: {max_sections}")
-                break
-            
-            current_path = to_visit.pop(0)
-            
-            if current_path in visited:
-                continue
-            visited.add(current_path)
-            
-            try:
-                doc = self.fetch_document(current_path)
-                documents.append(doc)
+        Same crawl and order as fetch_hmrc_manual, but the caller can
+        parse or store each document and let it go before the rest of
+        the manual is fetched.
+        """
+        fetch_section = partial(self._try_fetch, store_raw=store_raw)
+        fetched = 0
+        # Paths are marked as queued when first seen, so each is queued
+        # and fetched once however many sections link to it
+        queued = {manual_path}
+        to_visit = deque([manual_path])
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while to_visit:
+                if max_sections and fetched >= max_sections:
+                    logger.info(f"Reached max_sections limit: {max_sections}")
+                    break
                 
-                # Add child sections to crawl
-                for child in doc.child_sections:
-                    child_path = child.get("path", "")
-                    if child_path and child_path not in visited:
-                        to_visit.append(child_path)
+                # Take the next few paths, never more than max_sections
+                # still has room for
+                batch_size = self.max_workers
+                if max_sections:
+                    batch_size = min(batch_size, max_sections - fetched)
                 
-                logger.info(f"Fetched: {doc.title} ({len(documents)} total)")
+                batch = [to_visit.popleft() for _ in range(min(batch_size, len(to_visit)))]
                 
-            except GovUKContentAPIError as e:
-                logger.error(f"Failed to fetch {current_path}: {e}")
-                continue
+                # map() yields in submission order, so documents come out
+                # in the same order as a one-at-a-time crawl
+                for doc in pool.map(fetch_section, batch):
+                    if doc is None:
+                        continue
+                    fetched += 1
+                    
+                    # Add child sections to crawl
+                    for child in doc.child_sections:
+                        child_path = child.get("path", "")
+                        if child_path and child_path not in queued:
+                            queued.add(child_path)
+                            to_visit.append(child_path)
+                    
+                    logger.info(f"Fetched: {doc.title} ({fetched} total)")
+                    yield doc
+    
+    def fetch_many(self, paths: Iterable[str], store_raw: bool = True) -> Iterator[GovUKDocument]:
+        """
+        Fetch several documents concurrently, yielding each as it arrives.
+        
+        Documents come back in completion order, not the order given, so
+        the caller can start parsing the first one while the rest are
+        still downloading. Paths that fail are logged and skipped.
         
-        return documents
+        Example:
+            for doc in client.fetch_many(client.get_tax_guidance_urls()):
+                parsed = parser.parse_gov_uk_document(doc)
+        """
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = [pool.submit(self._try_fetch, path, store_raw) for path in paths]
+            for future in as_completed(futures):
+                doc = future.result()
+                if doc is not None:
+                    yield doc
+        finally:
+            # Don't keep fetching for a caller that stopped iterating
+            pool.shutdown(cancel_futures=True)
+    
+    def _try_fetch(self, path: str, store_raw: bool = False) -> Optional[GovUKDocument]:
+        """Fetch one document, logging failures instead of raising."""
+        try:
+            return self.fetch_document(path, store_raw=store_raw)
+        except GovUKContentAPIError as e:
+            logger.error(f"Failed to fetch {path}: {e}")
+            return None
     
     def get_tax_guidance_urls(self) -> List[str]:
         """
@@ -390,83 +775,9 @@ class GovUKClient:
         This is our "seed list" — the core documents every UK SME needs.
         We start here and can expand based on related links.
         
-        Organized by topic for clarity.
+        See TAX_GUIDANCE_PATHS; the list is a fresh copy callers may extend.
         """
-        return [
-            # === VAT ===
-            "/vat-registration",
-            "/vat-rates",
-            "/vat-businesses",
-            "/vat-returns",
-            "/vat-record-keeping",
-            "/vat-flat-rate-scheme",
-            "/vat-cash-accounting-scheme",
-            "/vat-annual-accounting-scheme",
-            "/charge-reclaim-record-vat",
-            "/pay-vat",
-            "/vat-corrections",
-            "/vat-registration-thresholds",
-            
-            # === Corporation Tax ===
-            "/corporation-tax",
-            "/corporation-tax-rates",
-            "/prepare-file-annual-accounts-for-limited-company",
-            "/company-tax-returns",
-            "/pay-corporation-tax",
-            "/corporation-tax-accounting-periods-and-டுe-dates",
-            "/hmrc-internal-manuals/company-taxation-manual",
-            
-            # === Self Assessment / Income Tax ===
-            "/self-assessment-tax-returns",
-            "/register-for-self-assessment",
-            "/understand-self-assessment-bill",
-            "/pay-self-assessment-tax-bill",
-            "/self-assessment-tax-return-forms",
-            "/income-tax-rates",
-            "/personal-allowances",
-            "/tax-on-dividends",
-            
-            # === PAYE / Employers ===
-            "/paye-for-employers",
-            "/register-employer",
-            "/running-payroll",
-            "/payroll-annual-reporting",
-            "/pay-paye-tax",
-            "/employee-tax-codes",
-            "/national-minimum-wage-rates",
-            
-            # === National Insurance ===
-            "/national-insurance",
-            "/national-insurance-rates-letters",
-            "/self-employed-national-insurance-rates",
-            "/national-insurance-classes",
-            
-            # === Making Tax Digital ===
-            "/making-tax-digital-software",
-            "/check-if-youre-eligible-for-making-tax-digital-for-income-tax",
-            
-            # === HMRC Services (Guidance Navigation) ===
-            "/contact-hmrc",
-            "/government/organisations/hm-revenue-customs/contact",
-            "/sign-in-hmrc-online-services",
-            "/personal-tax-account",
-            "/tax-appeals",
-            "/complain-about-hmrc",
-            "/get-help-hmrc-extra-support",
-            "/dealing-hmrc-additional-needs",
-            
-            # === Business Records & Compliance ===
-            "/keeping-your-pay-tax-records",
-            "/self-employed-records",
-            "/running-a-limited-company",
-            "/set-up-sole-trader",
-            "/set-up-limited-company",
-            "/set-up-business-partnership",
-            
-            # === R&D Tax Credits ===
-            "/guidance/corporation-tax-research-and-development-rd-relief",
-            "/hmrc-internal-manuals/corporate-intangibles-research-and-development-manual",
-        ]
+        return list(TAX_GUIDANCE_PATHS)
     
     def get_hmrc_manual_urls(self) -> List[str]:
         """
@@ -475,12 +786,4 @@ class GovUKClient:
         These are the detailed manuals that accountants use.
         More technical than general guidance, but essential for accuracy.
         """
-        return [
-            "/hmrc-internal-manuals/vat-guide",  # Core VAT guidance
-            "/hmrc-internal-manuals/vat-registration",  # VAT registration details
-            "/hmrc-internal-manuals/company-taxation-manual",  # Corporation Tax
-            "/hmrc-internal-manuals/business-income-manual",  # Self-employed income
-            "/hmrc-internal-manuals/employment-income-manual",  # PAYE
-            "/hmrc-internal-manuals/corporate-intangibles-research-and-development-manual",  # R&D
-            "/hmrc-internal-manuals/self-assessment-manual",  # Self Assessment
-        ]
+        return list(HMRC_MANUAL_PATHS)
@@ -173,20 +173,24 @@ class LegalChunker:
     # REGEX PATTERNS FOR LEGAL CONTENT DETECTION
     # ==========================================================================
     
-    # HMRC manual section IDs
-    HMRC_SECTION_PATTERNS = [
-        re.compile(r'\b(VAT(?:REG|SC|TOS|INF|IT|NOT|POSS|FRS|REC|AOS|GEN|ADJ|PE|RA|SG|AM|DT|LAND|FIN|FS)\d{5})\b', re.I),
-        re.compile(r'\b(CTM\d{5})\b', re.I),          # Corporation Tax Manual
-        re.compile(r'\b(CG\d{5})\b', re.I),           # Capital Gains Manual
-        re.compile(r'\b(BIM\d{5})\b', re.I),          # Business Income Manual
-        re.compile(r'\b(EIM\d{5})\b', re.I),          # Employment Income Manual
-        re.compile(r'\b(TSEM\d{5})\b', re.I),         # Trusts, Settlements Manual
-        re.compile(r'\b(SAIM\d{5})\b', re.I),         # Savings and Investment Manual
-        re.compile(r'\b(PIM\d{5})\b', re.I),          # Property Income Manual
-        re.compile(r'\b(NIM\d{5})\b', re.I),          # National Insurance Manual
-        re.compile(r'\b(PAYE\d{5})\b', re.I),         # PAYE Manual
-        re.compile(r'\b(CH\d{5})\b', re.I),           # Compliance Handbook
-    ]
+    # HMRC manual section IDs. One alternative (and capture group) per
+    # manual, in priority order, so a single scan finds every ID and
+    # match.lastindex says which manual it belongs to.
+    HMRC_SECTION_PATTERN = re.compile(r'''
+        \b(?:
+            (VAT(?:REG|SC|TOS|INF|IT|NOT|POSS|FRS|REC|AOS|GEN|ADJ|PE|RA|SG|AM|DT|LAND|FIN|FS)\d{5})  # VAT manuals
+          | (CTM\d{5})       # Corporation Tax Manual
+          | (CG\d{5})        # Capital Gains Manual
+          | (BIM\d{5})       # Business Income Manual
+          | (EIM\d{5})       # Employment Income Manual
+          | (TSEM\d{5})      # Trusts, Settlements Manual
+          | (SAIM\d{5})      # Savings and Investment Manual
+          | (PIM\d{5})       # Property Income Manual
+          | (NIM\d{5})       # National Insurance Manual
+          | (PAYE\d{5})      # PAYE Manual
+          | (CH\d{5})        # Compliance Handbook
+        )\b
+    ''', re.I | re.X)
     
     # Condition list patterns
     CONDITION_START_PATTERN = re.compile(
@@ -238,6 +242,13 @@ class LegalChunker:
         re.compile(r'\b(?:write\s+to|post|address)[:\s]+', re.I),
     ]
     
+    # Table reference patterns
+    TABLE_REFERENCE_PATTERNS = [
+        re.compile(r'\b(?:see|refer\s+to)\s+(?:the\s+)?table\b', re.I),
+        re.compile(r'\btable\s+(?:below|above|following)\b', re.I),
+        re.compile(r'\bthe\s+following\s+table\b', re.I),
+    ]
+    
     # Cross-reference patterns
     CROSS_REF_PATTERNS = [
         re.compile(r'\b(?:see|refer\s+to)\s+(?:section|paragraph|chapter)\s+([\d.]+)', re.I),
@@ -268,19 +279,26 @@ class LegalChunker:
         Extract HMRC manual section ID from text.
         
         Returns the first matched ID like VATREG02200, CTM01500, etc.
+        IDs from manuals listed earlier in HMRC_SECTION_PATTERN win over
+        ones that appear earlier in the text.
         """
-        for pattern in self.HMRC_SECTION_PATTERNS:
-            match = pattern.search(text)
-            if match:
-                return match.group(1).upper()
-        return None
+        best = None
+        for match in self.HMRC_SECTION_PATTERN.finditer(text):
+            if best is None or match.lastindex < best.lastindex:
+                best = match
+                if best.lastindex == 1:
+                    break
+        
+        if best is None:
+            return None
+        return best.group(best.lastindex).upper()
     
     def _extract_all_section_ids(self, text: str) -> List[str]:
         """Extract all HMRC section IDs from text (for cross-references)."""
-        ids = []
-        for pattern in self.HMRC_SECTION_PATTERNS:
-            ids.extend(m.group(1).upper() for m in pattern.finditer(text))
-        return list(set(ids))
+        return list({
+            m.group(m.lastindex).upper()
+            for m in self.HMRC_SECTION_PATTERN.finditer(text)
+        })
     
     def _extract_paragraph_number(self, text: str) -> Optional[str]:
         """Extract paragraph number from text."""
@@ -289,30 +307,30 @@ class LegalChunker:
             return match.group(1)
         return None
     
-    def _detect_content_type(self, text: str) -> LegalContentType:
+    def _detect_content_type(
+        self,
+        text: str,
+        flags: Optional[Dict[LegalContentType, bool]] = None
+    ) -> LegalContentType:
         """
         Detect the primary content type of the text.
         
         Returns the most likely content type based on pattern matching.
+        flags, when given, says which types were already found in the text
+        (see _chunk_section), so it isn't scanned again.
         """
         # Check patterns in priority order
-        if any(p.search(text) for p in self.DEFINITION_PATTERNS):
-            return LegalContentType.DEFINITION
-        
-        if self.CONDITION_START_PATTERN.search(text) and self.CONDITION_ITEM_PATTERN.search(text):
-            return LegalContentType.CONDITION_LIST
-        
-        if any(p.search(text) for p in self.EXAMPLE_PATTERNS):
-            return LegalContentType.EXAMPLE
-        
-        if any(p.search(text) for p in self.CONTACT_PATTERNS):
-            return LegalContentType.CONTACT
-        
-        if any(p.search(text) for p in self.PENALTY_PATTERNS):
-            return LegalContentType.PENALTY
-        
-        if any(p.search(text) for p in self.DEADLINE_PATTERNS):
-            return LegalContentType.DEADLINE
+        for content_type, has_content in (
+            (LegalContentType.DEFINITION, self._has_definition),
+            (LegalContentType.CONDITION_LIST, self._has_condition_list),
+            (LegalContentType.EXAMPLE, self._has_example),
+            (LegalContentType.CONTACT, self._has_contact_info),
+            (LegalContentType.PENALTY, self._has_penalty_info),
+            (LegalContentType.DEADLINE, self._has_deadline),
+        ):
+            present = flags[content_type] if flags is not None else has_content(text)
+            if present:
+                return content_type
         
         return LegalContentType.GENERAL
     
@@ -362,12 +380,7 @@ class LegalChunker:
     
     def _has_table_reference(self, text: str) -> bool:
         """Check if text references a table."""
-        table_patterns = [
-            r'\b(?:see|refer\s+to)\s+(?:the\s+)?table\b',
-            r'\btable\s+(?:below|above|following)\b',
-            r'\bthe\s+following\s+table\b',
-        ]
-        return any(re.search(p, text, re.I) for p in table_patterns)
+        return any(p.search(text) for p in self.TABLE_REFERENCE_PATTERNS)
     
     # ==========================================================================
     # CITATION GENERATION
@@ -638,8 +651,22 @@ class LegalChunker:
                     source_url=source_url
                 )
             
-            # Detect content characteristics
-            content_type = self._detect_content_type(piece) if self.config.detect_content_type else LegalContentType.GENERAL
+            # Detect content characteristics once; the content type is
+            # read off the same flags
+            flags = {
+                LegalContentType.DEFINITION: self._has_definition(piece),
+                LegalContentType.CONDITION_LIST: self._has_condition_list(piece),
+                LegalContentType.EXAMPLE: self._has_example(piece),
+                LegalContentType.CONTACT: self._has_contact_info(piece),
+                LegalContentType.PENALTY: self._has_penalty_info(piece),
+                LegalContentType.DEADLINE: self._has_deadline(piece),
+            }
+            content_type = (
+                self._detect_content_type(piece, flags)
+                if self.config.detect_content_type
+                else LegalContentType.GENERAL
+            )
+            
             cross_refs = self._detect_cross_references(piece)
             
             # Remove the section_id from cross_refs if it matches the section's own ID
@@ -659,13 +686,13 @@ class LegalChunker:
                 paragraph_number=paragraph_num,
                 citable_reference=citable_ref,
                 content_type=content_type,
-                contains_condition_list=self._has_condition_list(piece),
-                contains_definition=self._has_definition(piece),
-                contains_example=self._has_example(piece),
+                contains_condition_list=flags[LegalContentType.CONDITION_LIST],
+                contains_definition=flags[LegalContentType.DEFINITION],
+                contains_example=flags[LegalContentType.EXAMPLE],
                 contains_table_reference=self._has_table_reference(piece),
-                contains_deadline=self._has_deadline(piece),
-                contains_penalty_info=self._has_penalty_info(piece),
-                contains_contact_info=self._has_contact_info(piece),
+                contains_deadline=flags[LegalContentType.DEADLINE],
+                contains_penalty_info=flags[LegalContentType.PENALTY],
+                contains_contact_info=flags[LegalContentType.CONTACT],
                 cross_references=cross_refs,
                 has_overlap_with_previous=(i > 0),
             )
@@ -402,7 +402,7 @@ class IngestionPipeline:
             if self.config.verbose:
                 logger.info(f"Fetching: {url}")
             
-            gov_doc = self.gov_uk_client.fetch_document(url)
+            gov_doc = self.gov_uk_client.fetch_document(url, store_raw=False)
             
             # Step 2: Parse content
             parsed_doc = self.parser.parse_gov_uk_document(gov_doc)
@@ -709,14 +709,13 @@ class IngestionPipeline:
         """
         logger.info(f"Crawling HMRC manual: {manual_path}")
         
-        # Fetch all documents in manual
-        documents = self.gov_uk_client.fetch_hmrc_manual(
-            manual_path, 
-            max_sections=max_sections
-        )
-        
-        # Extract URLs
-        urls = [doc.url for doc in documents]
+        # Crawl the manual, keeping only each section's URL
+        urls = [
+            doc.url for doc in self.gov_uk_client.iter_hmrc_manual(
+                manual_path,
+                max_sections=max_sections
+            )
+        ]
         
         logger.info(f"Found {len(urls)} sections in manual")
         
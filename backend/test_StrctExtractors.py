@@ -137,6 +137,15 @@ def test_legal_chunker():
     assert stats['with_section_ids'] > 0
     print(f"   ✓ Stats: {stats['count']} chunks, {stats['with_section_ids']} with section IDs")
     
+    # Test 5: Section ID priority follows manual order, not text order
+    print("\n5. Testing HMRC section ID priority...")
+    mixed = "See CTM01500 and pim12345, then VATREG02200 (not VATREG022001 or xCH12345)."
+    assert chunker._extract_hmrc_section_id(mixed) == "VATREG02200"
+    assert chunker._extract_hmrc_section_id("PIM12345 and CTM01500") == "CTM01500"
+    assert chunker._extract_hmrc_section_id("No manual references here") is None
+    assert sorted(chunker._extract_all_section_ids(mixed)) == ["CTM01500", "PIM12345", "VATREG02200"]
+    print(f"   ✓ Section ID priority preserved")
+    
     print("\n✅ Legal Chunker tests PASSED")
     return True
 
@@ -224,6 +233,51 @@ def test_table_extractor():
     assert len(table.readable_text) > 0, "Should generate readable text"
     print(f"   ✓ Generated readable text ({len(table.readable_text)} chars)")
     
+    # Test 7: Pages without tables
+    print("\n7. Testing pages without tables...")
+    assert extractor.has_tables(html.upper()), "Should detect upper-case table tags"
+    no_tables = "<h2>Tax rates</h2><p>The basic rate is 20%.</p>"
+    assert not extractor.has_tables(no_tables), "Should not detect tables in plain HTML"
+    empty = extractor.extract(no_tables, text_content, "https://gov.uk/tax-rates")
+    assert not empty.has_items and not empty.has_errors, "Should return an empty result"
+    print("   ✓ No tables extracted")
+    
+    # Test 8: Cell value cache
+    print("\n8. Testing cell value cache...")
+    repeat = extractor.extract(html, text_content, "https://gov.uk/tax-rates", tax_year="2024-25")
+    assert repeat.items[0].rows == table.rows, "Cached cell values should match"
+    TableExtractor.clear_cache()
+    assert TableExtractor._parse_cell_text.cache_info().currsize == 0, "Cache should be empty after clearing"
+    print("   ✓ Cell values cached")
+    
+    # Test 9: Deeply nested cell markup
+    print("\n9. Testing deeply nested cells...")
+    nested = "<span>" * 2000 + "20%" + "</span>" * 2000
+    deep = extractor.extract(f"<table><tr><th>Rate</th></tr><tr><td>{nested}</td></tr></table>", "", "https://gov.uk/deep")
+    assert deep.has_items and deep.items[0].rows == [{"Rate": 20.0}], f"Should parse nested cell, got {deep.warnings}"
+    print("   ✓ Nested cell parsed")
+    
+    # Test 10: Unique header names
+    print("\n10. Testing unique header names...")
+    unique = extractor._make_headers_unique(["Rate", "Rate", "Rate_1", "Rate"])
+    assert unique == ["Rate", "Rate_1", "Rate_1_1", "Rate_2"], f"Headers should be unique, got {unique}"
+    print(f"   ✓ Headers: {unique}")
+    
+    # Test 11: Raw HTML
+    print("\n11. Testing raw HTML...")
+    assert table.raw_html.startswith("<table>"), "Raw HTML should be the table markup"
+    assert "Tax Rate" in table.raw_html, "Raw HTML should include the headers"
+    print(f"   ✓ Raw HTML ({len(table.raw_html)} chars)")
+    
+    # Test 12: Parallel document batch
+    print("\n12. Testing parallel document batch...")
+    documents = [(html, text_content, "https://gov.uk/tax-rates"), (no_tables, "", "https://gov.uk/none")] * 10
+    batch = extractor.extract_batch(documents, workers=2, tax_year="2024-25")
+    assert [[(t.to_dict(), t.raw_html) for t in res.items] for res in batch] == \
+        [[(t.to_dict(), t.raw_html) for t in extractor.extract(*doc, tax_year="2024-25").items] for doc in documents], \
+        "Batch results should match per-document extraction"
+    print(f"   ✓ {len(batch)} documents processed")
+    
     print("\n✅ Table Extractor tests PASSED")
     return True
 
@@ -253,6 +307,7 @@ def test_formula_extractor():
     # Test 1: Formula detection
     print("\n1. Testing formula detection...")
     assert extractor.has_formulas(text), "Should detect formulas in text"
+    assert extractor.has_formulas("Multiply your profits by the rate"), "Operator words should count as indicators"
     print("   ✓ Formula detected in text")
     
     # Test 2: Formula extraction
@@ -271,13 +326,26 @@ def test_formula_extractor():
     # Test 4: Variables
     print("\n4. Testing variable extraction...")
     assert len(formula.variables) > 0, "Should extract variables"
-    print(f"   ✓ Variables: {list(formula.variables.keys())}")
+    print(f"   ✓ Variables: {[var.name for var in formula.variables]}")
     
     # Test 5: Formula logic
     print("\n5. Testing formula logic...")
     assert formula.formula_logic is not None, "Should have formula logic"
     print(f"   ✓ Formula logic type: {formula.formula_logic.get('type')}")
-    
+
+    # Test 6: Batch extraction
+    print("\n6. Testing batch extraction...")
+    narrative = "This page describes the history of HMRC offices."
+    batch = extractor.extract_batch([
+        (text, "https://gov.uk/corporation-tax-rates"),
+        (narrative, "https://gov.uk/history"),
+    ], tax_year="2024-25")
+    assert len(batch) == 2, "Should return one result per document"
+    assert [f.formula_name for f in batch[0].items] == [f.formula_name for f in result.items], \
+        "Batch results should match single-document extraction"
+    assert not batch[1].has_items, "Narrative document should have no formulas"
+    print(f"   ✓ Batch of {len(batch)} documents matches single extraction")
+
     print("\n✅ Formula Extractor tests PASSED")
     return True
 
@@ -530,6 +598,16 @@ def test_reference_detector():
     sec_refs = [r for r in result.items if r.reference_type == 'section']
     print(f"   ✓ Section refs: {[r.reference_text for r in sec_refs]}")
     
+    # Test 6: Parallel document batch
+    print("\n6. Testing parallel document batch...")
+    documents = [(html, text, "https://gov.uk/vat"), (None, "No references here.", "https://gov.uk/none")] * 10
+    batch = detector.extract_batch(documents, workers=2)
+    assert [[r.to_dict() for r in res.items] for res in batch] == \
+        [[r.to_dict() for r in detector.extract(*doc).items] for doc in documents], \
+        "Batch results should match per-document extraction"
+    assert detector.extract_batch([]) == [], "An empty batch should give no results"
+    print(f"   ✓ {len(batch)} documents processed")
+    
     print("\n✅ Reference Detector tests PASSED")
     return True
 
@@ -566,7 +644,7 @@ def test_metadata_extractor():
     metadata = result.items[0]
     
     assert len(metadata.thresholds) > 0, "Should extract thresholds"
-    threshold_values = [t['value'] for t in metadata.thresholds]
+    threshold_values = [t.value for t in metadata.thresholds]
     print(f"   ✓ Thresholds: {threshold_values}")
     
     # Test 2: Tax year extraction
@@ -576,7 +654,7 @@ def test_metadata_extractor():
     
     # Test 3: Form extraction
     print("\n3. Testing form extraction...")
-    form_codes = [f['code'] for f in metadata.forms]
+    form_codes = [f.code for f in metadata.forms]
     assert "VAT1" in form_codes, f"Should find VAT1, got {form_codes}"
     assert "SA100" in form_codes, f"Should find SA100, got {form_codes}"
     print(f"   ✓ Forms: {form_codes}")
@@ -584,7 +662,7 @@ def test_metadata_extractor():
     # Test 4: Key date extraction
     print("\n4. Testing key date extraction...")
     assert len(metadata.key_dates) > 0, "Should extract key dates"
-    print(f"   ✓ Key dates: {[(d['day'], d['month']) for d in metadata.key_dates]}")
+    print(f"   ✓ Key dates: {[(d.day, d.month) for d in metadata.key_dates]}")
     
     # Test 5: Topic classification
     print("\n5. Testing topic classification...")
@@ -601,6 +679,58 @@ def test_metadata_extractor():
     assert len(metadata.keywords) > 0, "Should extract keywords"
     print(f"   ✓ Keywords: {metadata.keywords[:10]}...")  # First 10
     
+    # Test 8: Non-breaking spaces (common in gov.uk HTML)
+    print("\n8. Testing non-breaking spaces...")
+    nbsp_text = "The VAT registration\xa0threshold:\xa0£90,000 applies from 1\xa0April."
+    nbsp_metadata = extractor.extract_for_chunk(nbsp_text)
+    assert [t.value for t in nbsp_metadata.thresholds] == [90000], \
+        f"Should find £90,000, got {nbsp_metadata.thresholds}"
+    assert [(d.day, d.month) for d in nbsp_metadata.key_dates] == [(1, "April")], \
+        f"Should find 1 April, got {nbsp_metadata.key_dates}"
+    print(f"   ✓ Thresholds: {[t.value for t in nbsp_metadata.thresholds]}")
+    
+    # Test 9: Chunk cache
+    print("\n9. Testing chunk cache...")
+    cached = extractor.extract_for_chunk(nbsp_text)
+    assert cached.to_dict() == nbsp_metadata.to_dict(), "Cached chunk metadata should match"
+    cached.thresholds.clear()
+    assert extractor.extract_for_chunk(nbsp_text).thresholds, "Callers should get independent copies"
+    MetadataExtractor.clear_cache()
+    bounded = MetadataExtractor()
+    bounded.CHUNK_CACHE_MAX_CHARS = 200
+    for i in range(5):
+        bounded.extract_for_chunk(f"{nbsp_text} {i}")
+    assert 0 < MetadataExtractor._chunk_cache_chars <= 200, "Cache should stay within its character bound"
+    MetadataExtractor.clear_cache()
+    print("   ✓ Cached results are returned as copies and bounded by size")
+    
+    # Test 10: Parallel chunk batch
+    print("\n10. Testing parallel chunk batch...")
+    chunks = [f"{(text, nbsp_text, 'No metadata here.')[i % 3]} {i}" for i in range(300)] * 2
+    batch = extractor.extract_for_chunks_batch(chunks, workers=2)
+    assert len(MetadataExtractor._chunk_cache) == 300, "Batch results should be cached in this process"
+    assert [m.to_dict() for m in batch] == [extractor.extract_for_chunk(c).to_dict() for c in chunks], \
+        "Batch results should match per-chunk extraction"
+    MetadataExtractor.clear_cache()
+    print(f"   ✓ {len(batch)} chunks extracted")
+    
+    # Test 11: Streaming extraction
+    print("\n11. Testing streaming extraction...")
+    streamed = extractor.extract_streaming(text[i:i + 40] for i in range(0, len(text), 40))
+    assert sorted(t.value for t in streamed.thresholds) == sorted(threshold_values), \
+        f"Streaming should find the same thresholds, got {streamed.thresholds}"
+    assert [f.code for f in streamed.forms] == form_codes, "Streaming should find the same forms"
+    assert streamed.tax_years == metadata.tax_years, "Streaming should find the same tax years"
+    assert streamed.topics == metadata.topics, "Streaming should classify the same topics"
+    print(f"   ✓ Streamed {len(text)} chars in 40-char pieces")
+    
+    # Test 12: Overlapping threshold matches
+    print("\n12. Testing overlapping threshold matches...")
+    overlap = extractor.extract_for_chunk("£1,000 threshold is £12,570")
+    assert [(t.value, t.type) for t in overlap.thresholds] == [(12570, "threshold"), (1000, "threshold")], \
+        f"Should find both amounts, got {overlap.thresholds}"
+    print(f"   ✓ Thresholds: {[t.value for t in overlap.thresholds]}")
+    
     print("\n✅ Metadata Extractor tests PASSED")
     return True
 